@@ -92,6 +92,7 @@ def run(context):
         app = adsk.core.Application.get()
         ui = app.userInterface
 
+        release_handlers(ui)
         delete_tabgen(ui)
 
         # Create the command definition and add a button to the Add-ins panel
@@ -115,6 +116,7 @@ def stop(context):
         app = adsk.core.Application.get()
         ui = app.userInterface
 
+        release_handlers(ui)
         delete_tabgen(ui)
 
     except:
@@ -124,6 +126,19 @@ def stop(context):
             ui.messageBox(msg)
 
 
+def release_handlers(ui):
+    """ Disconnect the command created handlers, and the handlers of a
+        command that is still open, so that nothing is left behind
+        when the add-in is restarted.
+        """
+    cmd_def = ui.commandDefinitions.itemById(defs.tabGenCommandId)
+    for panel in handlers:
+        if cmd_def:
+            cmd_def.commandCreated.remove(panel)
+        panel.release()
+    handlers.clear()
+
+
 def delete_tabgen(ui):
     addins = ui.allToolbarPanels.itemById(defs.parentPanelId)
     cmd_def = initialize_panel(ui)
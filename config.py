@@ -32,6 +32,12 @@ class Configuration:
     DEFAULT_DISABLE_PARAMETRIC = False
     DEFAULT_ENABLE_PREVIEW = True
 
+    # Select one of the two following
+    # Graphics previews draw the planned cuts instead of creating
+    # the features, which is much faster on large bodies.
+    DEFAULT_PREVIEW_FEATURES = True
+    DEFAULT_PREVIEW_GRAPHICS = False
+
     # Select one of the two following
     DEFAULT_USER_WIDTH_TAB = False
     DEFAULT_AUTO_WIDTH_TAB = True
@@ -46,6 +52,21 @@ class Configuration:
     DEFAULT_WALL_COUNT = 0
     DEFAULT_REPEAT_COUNT = 0
 
+    # Limits on the estimated size of the generated features. Large
+    # patterns can lock up Fusion for minutes while they compute.
+    # Above the preview limits the preview is reduced: first to fewer
+    # notches, then to the primary face only, and it is skipped if even
+    # that is too large. Executing asks for confirmation above the
+    # warning limit, and is refused above the maximum. Set a limit to
+    # None to disable it.
+    PREVIEW_MAX_INSTANCES = 150
+    WARN_INSTANCES = 400
+    MAX_INSTANCES = 2000
+
+    # Seconds that the spinners have to be idle before the preview
+    # is rebuilt; 0 rebuilds the preview on every change.
+    PREVIEW_DEBOUNCE_INTERVAL = 0.35
+
     def __init__(self, app):
         self.app = app
         self.ui = app.userInterface
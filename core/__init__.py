@@ -1,5 +1,6 @@
 from . import definitions
-from . import handlers
 
-__all__ = [definitions,
-           handlers]
+# The handlers package is imported directly by TabGen.py. It is not
+# imported here, so that the pure-Python packages, such as layout,
+# can be used without the Fusion 360 API being available.
+__all__ = [definitions]
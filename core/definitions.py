@@ -18,6 +18,8 @@ repeatInputId = 'repeatValueInput'
 patternDistanceInputId = 'patternValueInput'
 referenceSelectId = 'referenceSelectInput'
 previewInputId = 'previewCommandInput'
+previewModeId = 'previewModeInput'
+previewLevelId = 'previewLevelInput'
 kerfInputId = 'kerfValueInput'
 tabCountInputId = 'tabCountValueInput'
 
@@ -32,6 +34,9 @@ constantCountId = 'Constant Count'
 singleEdgeId = 'Single Edge'
 dualEdgeId = 'Dual Edge'
 
+previewFeaturesId = 'Features'
+previewGraphicsId = 'Graphics'
+
 
 __all__ = [automaticWidthId,
            dualSidesInputId,
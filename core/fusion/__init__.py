@@ -1,12 +1,16 @@
 from .inputs import InputReader
 from .inputs import ChangedInputs
+from .cache import SessionCache
 from .body import add_face
 from .body import check_if_edge
 from .body import next_face_id
 from .body import number_of_faces
+from .body import save_joints
+from .body import saved_joints
 from .face import dimensions
 from .face import distance_between
 from .face import edge_on_face
+from .face import face_frame
 from .face import face_orientation
 from .face import parallel_to_edge
 from .face import perpendicular_edge_from_vertex, perpendicular_edge_from_line
@@ -22,6 +26,7 @@ __all__ = [
     dimensions,
     distance_between,
     edge_on_face,
+    face_frame,
     face_orientation,
     inputs,
     next_face_id,
@@ -31,5 +36,8 @@ __all__ = [
     perpendicular_edge_from_line,
     perpendicular_edge_from_vertex,
     Rectangle,
+    SessionCache,
+    save_joints,
+    saved_joints,
     vertex_distance
 ]
@@ -1,11 +1,21 @@
 from .addface import add_face
 from .checkedge import check_if_edge
+from .faceclassification import classification_key
+from .faceclassification import FaceClassification
 from .faceid import next_face_id
+from .joints import save_joints
+from .joints import saved_joints
 from .numberfaces import number_of_faces
+from .topology import Topology
 
 __all__ = [
     add_face,
     check_if_edge,
+    classification_key,
+    FaceClassification,
     next_face_id,
-    number_of_faces
+    number_of_faces,
+    save_joints,
+    saved_joints,
+    Topology
 ]
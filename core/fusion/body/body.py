@@ -1,4 +1,5 @@
 # from .sketch import Sketch
+from .topology import Topology
 
 
 class Body:
@@ -9,6 +10,7 @@ class Body:
 
     def __init__(self, brepbody):
         self.brepbody = brepbody
+        self._topology = None
         self.edge_faces = sorted(self.faces, key=lambda face: face.area)[:-2]
 
         self.token = self.brepbody.attributes.itemByName('tabgen', 'tabbed_faces')
@@ -38,7 +40,11 @@ class Body:
             face_id.value = self.token.value
         return int(self.token.value)
 
+    @property
+    def topology(self):
+        if self._topology is None:
+            self._topology = Topology(self.brepbody)
+        return self._topology
+
     def edge_by_sketch_point(self, point):
-        for edge in self.edges:
-            if point in (edge.startVertex, edge.endVertex):
-                return edge
+        return self.topology.edge_at(point)
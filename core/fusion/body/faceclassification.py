@@ -0,0 +1,199 @@
+from collections import namedtuple
+
+TOLERANCE = 1e-6
+
+# Faces are bucketed by rounded normals and areas
+NORMAL_PLACES = 6
+AREA_PLACES = 3
+
+# Faces read for each step of a classification spread over idle time
+FACES_PER_STEP = 8
+
+# index: the position of the face in the body
+# token: the entity token of the face
+# offset: the signed offset of the face's plane along the bucket normal
+# facing: 1 if the face points along the bucket normal, otherwise -1
+Candidate = namedtuple('Candidate', ['index', 'token', 'offset', 'facing'])
+
+
+def _normal(brepface):
+    """ The unit outward normal of a planar face, or None for any other
+        face.
+        """
+    normal = getattr(brepface.geometry, 'normal', None)
+    if normal is None:
+        return None
+    normal = normal.copy()
+    normal.normalize()
+    if brepface.isParamReversed:
+        normal.scaleBy(-1)
+    return (normal.x, normal.y, normal.z)
+
+
+def _direction(normal):
+    """ The rounded normal, flipped so that faces pointing in opposite
+        directions share a bucket, and whether it was flipped.
+        """
+    rounded = tuple(round(value, NORMAL_PLACES) + 0 for value in normal)
+    for value in rounded:
+        if value:
+            if value < 0:
+                return tuple(-item + 0 for item in rounded), -1
+            break
+    return rounded, 1
+
+
+def timeline_position(body):
+    """ The timeline marker position of the body's design, or None when
+        the design isn't parametric and has no timeline.
+        """
+    try:
+        return body.parentComponent.parentDesign.timeline.markerPosition
+    except (AttributeError, RuntimeError):
+        return None
+
+
+def classification_key(body):
+    """ Changes whenever the body could have been modified: the marker
+        moves with every feature, and the face count catches direct
+        edits.
+        """
+    return (body.entityToken, timeline_position(body), body.faces.count)
+
+
+def _bucket(brepface, normal):
+    """ The bucket key of a planar face, and its candidate values.
+        """
+    direction, facing = _direction(normal)
+    origin = brepface.geometry.origin
+    offset = sum(a*b for a, b in zip(direction, (origin.x, origin.y, origin.z)))
+    return (direction, round(brepface.area, AREA_PLACES)), offset, facing
+
+
+class FaceClassification:
+    """ Which faces of a body are edge faces, and the normals of its
+        planar faces, computed once so that hovering over a face only
+        costs a lookup.
+
+        Faces are found by their entity tokens. Fusion doesn't guarantee
+        that a face has the same token every time it is read, so a face
+        that isn't found is compared with the faces of the body, and
+        classified from its geometry if it still isn't found.
+        """
+
+    def __init__(self, body):
+        for _ in self._read(body):
+            pass
+
+    @classmethod
+    def in_steps(cls, body, size=FACES_PER_STEP):
+        """ Classify the faces size at a time. A generator that yields
+            None after each slice of faces, and the classification once
+            all of them have been read.
+            """
+        classification = cls.__new__(cls)
+        yield from classification._read(body, size)
+        yield classification
+
+    def _read(self, body, size=None):
+        self.faces = list(body.faces)
+        self.tokens = []
+        self.indices = {}
+        self.normals = []
+        self.candidates = {}
+        self.buckets = {}
+        areas = []
+
+        for index, face in enumerate(self.faces):
+            if size and index and not index % size:
+                yield
+
+            token = face.entityToken
+            self.tokens.append(token)
+            self.indices[token] = index
+            areas.append(face.area)
+
+            normal = _normal(face)
+            self.normals.append(normal)
+            if normal is None:
+                continue
+            key, offset, facing = _bucket(face, normal)
+
+            candidate = Candidate(index, token, offset, facing)
+            self.candidates[index] = (key, candidate)
+            self.buckets.setdefault(key, []).append(candidate)
+
+        by_area = sorted(range(len(self.faces)), key=lambda index: areas[index])
+
+        # The two largest faces of a board are its top and bottom
+        self.edges = frozenset(by_area[:-2])
+        self.largest = [areas[index] for index in by_area[-2:]]
+
+    def _index(self, brepface):
+        """ The position of the face in the body, or None if it isn't a
+            face of the body.
+            """
+        token = brepface.entityToken
+        index = self.indices.get(token)
+        if index is None:
+            for position, face in enumerate(self.faces):
+                if face.isValid and face == brepface:
+                    index = self.indices[token] = position
+                    break
+        return index
+
+    def _normal(self, brepface):
+        index = self._index(brepface)
+        return self.normals[index] if index is not None else _normal(brepface)
+
+    def is_edge(self, brepface):
+        index = self._index(brepface)
+        if index is not None:
+            return index in self.edges
+
+        # Any face smaller than the top and bottom of the board
+        return len(self.largest) == 2 and brepface.area < self.largest[0] - TOLERANCE
+
+    def parallel(self, brepface, other):
+        """ Whether two planar faces are parallel, or None if either
+            face isn't planar.
+            """
+        normal = self._normal(brepface)
+        other_normal = self._normal(other)
+        if normal is None or other_normal is None:
+            return None
+
+        dot = sum(a*b for a, b in zip(normal, other_normal))
+        return abs(abs(dot) - 1) < TOLERANCE
+
+    def opposite(self, brepface):
+        """ The token of the face opposite a planar face: a parallel face
+            of the same area. When there are several, faces pointing the
+            other way come first, then the farthest, then the first in
+            the body, so the same face is always chosen.
+            """
+        index = self._index(brepface)
+        if index is not None:
+            entry = self.candidates.get(index)
+            if entry is None:
+                return None
+            key, face = entry
+        else:
+            normal = _normal(brepface)
+            if normal is None:
+                return None
+            key, offset, facing = _bucket(brepface, normal)
+            face = Candidate(None, None, offset, facing)
+
+        def same(candidate):
+            if face.index is not None:
+                return candidate.index == face.index
+            return candidate.facing == face.facing and abs(candidate.offset - face.offset) < TOLERANCE
+
+        def rank(candidate):
+            return (candidate.facing == face.facing,
+                    -abs(candidate.offset - face.offset),
+                    candidate.index)
+
+        others = [candidate for candidate in self.buckets.get(key, ()) if not same(candidate)]
+        return min(others, key=rank).token if others else None
@@ -0,0 +1,56 @@
+import json
+
+from ...layout import corners
+
+
+def _read(brepbody):
+    attribute = brepbody.attributes.itemByName('tabgen', 'joints')
+    if not attribute:
+        return attribute, []
+    try:
+        return attribute, [corners.from_dict(data) for data in json.loads(attribute.value)]
+    except (ValueError, KeyError, TypeError):
+        # Written by another version of TabGen
+        return attribute, []
+
+
+def _write(brepbody, attribute, joints):
+    value = json.dumps([corners.as_dict(joint) for joint in joints])
+    if not attribute:
+        brepbody.attributes.add('tabgen', 'joints', value)
+    else:
+        attribute.value = value
+
+
+def saved_joints(brepbody):
+    """ The finger joints that were placed on the body. They are kept
+        together in one attribute of the body, so they are read with a
+        single lookup no matter how many faces the body has.
+
+        Joints whose features have been deleted since are dropped from
+        the attribute, and joints whose features are suppressed are
+        skipped.
+        """
+    attribute, joints = _read(brepbody)
+    if not joints:
+        return []
+
+    extrudes = brepbody.parentComponent.features.extrudeFeatures
+    features = {joint.feature: extrudes.itemByName(joint.feature) if joint.feature else None
+                for joint in joints}
+
+    found = [joint for joint in joints if features[joint.feature]]
+    if len(found) < len(joints):
+        _write(brepbody, attribute, found)
+
+    return [joint for joint in found if not features[joint.feature].isSuppressed]
+
+
+def save_joints(brepbody, joints):
+    """ Add the joints to the body, replacing the joints that were saved
+        earlier with the same names.
+        """
+    names = {joint.name for joint in joints}
+    attribute, saved = _read(brepbody)
+    saved = [joint for joint in saved if joint.name not in names]
+    _write(brepbody, attribute, saved + list(joints))
@@ -0,0 +1,139 @@
+""" The connections between the vertices, edges and faces of a body,
+    read from the API once, so that finding the edges around a face is
+    a dictionary lookup.
+
+    Fusion doesn't guarantee that an entity has the same token every
+    time it is read, so a lookup can miss for an entity of the body.
+    Every lookup falls back to the API when it does.
+    """
+TOLERANCE = 1e-6
+
+
+def _unit(vector):
+    length = sum(value*value for value in vector)**0.5
+    if not length:
+        return None
+    return tuple(value/length for value in vector)
+
+
+def _point(vertex):
+    point = vertex.geometry
+    return (point.x, point.y, point.z)
+
+
+def _normal(brepface):
+    normal = getattr(brepface.geometry, 'normal', None)
+    if normal is None:
+        return None
+    return _unit((normal.x, normal.y, normal.z))
+
+
+class Topology:
+    """ Edges are identified by their position in the body; vertices
+        and faces by their entity tokens.
+        """
+
+    def __init__(self, body):
+        self.body = body
+
+        self.edges = []
+        self.vertices = {}
+        self.points = {}
+        self.edge_vertices = []
+        self.edge_faces = []
+        self.directions = []
+        self.vertex_edges = {}
+        self.face_edges = {}
+        self.normals = {}
+        self.adjacent = {}
+
+        for face in body.faces:
+            token = face.entityToken
+            self.face_edges[token] = []
+            self.normals[token] = _normal(face)
+            self.adjacent[token] = set()
+
+        for index, edge in enumerate(body.edges):
+            start, end = edge.startVertex, edge.endVertex
+            ends = (start.entityToken, end.entityToken)
+            for token, vertex in zip(ends, (start, end)):
+                if token not in self.vertices:
+                    self.vertices[token] = vertex
+                    self.points[token] = _point(vertex)
+                self.vertex_edges.setdefault(token, [])
+                if index not in self.vertex_edges[token]:
+                    self.vertex_edges[token].append(index)
+
+            faces = [face.entityToken for face in edge.faces]
+            for token in faces:
+                self.face_edges.setdefault(token, []).append(index)
+                self.adjacent.setdefault(token, set()).update(other for other in faces if other != token)
+
+            # Only straight edges have a direction
+            if edge.geometry.objectType == 'adsk::core::Line3D' and ends[0] != ends[1]:
+                direction = _unit([b - a for a, b in zip(self.points[ends[0]], self.points[ends[1]])])
+            else:
+                direction = None
+
+            self.edges.append(edge)
+            self.edge_vertices.append(ends)
+            self.edge_faces.append(faces)
+            self.directions.append(direction)
+
+    @property
+    def isValid(self):
+        return self.body.isValid
+
+    def edge_at(self, vertex):
+        """ The first edge of the body that ends at the vertex.
+            """
+        indices = self.vertex_edges.get(vertex.entityToken)
+        if indices:
+            return self.edges[indices[0]]
+
+        for edge in self.body.edges:
+            if vertex in (edge.startVertex, edge.endVertex):
+                return edge
+        return None
+
+    def other_end(self, index, token):
+        """ The vertex at the other end of the edge from the vertex with
+            the given token.
+            """
+        start, end = self.edge_vertices[index]
+        return self.vertices[end if start == token else start]
+
+    def vertex_at(self, brepface, point):
+        """ The token of the vertex of the face at the Point3D. Any
+            vertex of the body at the point is matched if the face isn't
+            found by its token.
+            """
+        target = (point.x, point.y, point.z)
+        indices = self.face_edges.get(brepface.entityToken)
+        if indices is None:
+            tokens = self.points
+        else:
+            tokens = (token for index in indices for token in self.edge_vertices[index])
+
+        for token in tokens:
+            if all(abs(a - b) < TOLERANCE for a, b in zip(self.points[token], target)):
+                return token
+        return None
+
+    def perpendicular(self, brepface, token):
+        """ The edges at the vertex that are perpendicular to the planar
+            face, in the order that the vertex lists them.
+            """
+        face_token = brepface.entityToken
+        normal = self.normals[face_token] if face_token in self.normals else _normal(brepface)
+        if normal is None:
+            return []
+
+        found = []
+        for index in self.vertex_edges.get(token, ()):
+            direction = self.directions[index]
+            if direction is None:
+                continue
+            if abs(abs(sum(a*b for a, b in zip(normal, direction))) - 1) < TOLERANCE:
+                found.append(index)
+        return found
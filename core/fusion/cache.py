@@ -0,0 +1,133 @@
+""" A cache of the analysis of the selected faces, kept for as long as
+    the command dialog is open.
+
+    Fusion rolls back everything that a preview creates, so the sketch,
+    border and features still have to be created again for every
+    preview. What doesn't change between previews -- the orientation
+    and size of the faces, the distance between them, the edges used as
+    pattern axes, and the computed finger properties -- is looked up by
+    the entity tokens of the selections, plus the input values that it
+    was computed from. The classification of a body's faces is also
+    keyed by the timeline marker, so that it's computed again when the
+    body changes.
+    """
+from collections import OrderedDict
+
+from .body import classification_key
+from .body import FaceClassification
+from .body import Topology
+from .face import dimensions
+from .face import distance_between_faces
+from .face import face_frame
+from .face import face_orientation
+from .face import perpendicular_edge_from_vertex
+
+
+def entity_token(entity):
+    return entity.entityToken if entity else None
+
+
+def _valid(value):
+    """ Entities from an earlier preview can be invalid after the
+        rollback; those are computed again.
+        """
+    for item in value if isinstance(value, tuple) else (value,):
+        if not getattr(item, 'isValid', True):
+            return False
+    return True
+
+
+class SessionCache:
+
+    def __init__(self, size=128):
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        # The custom graphics group of the current graphics preview
+        self.graphics = None
+
+    def get(self, key, compute):
+        """ The cached value for the key, or the value returned by
+            compute, which is then cached.
+            """
+        value = self.entries.get(key)
+        if key in self.entries and _valid(value):
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = compute()
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        self.entries.clear()
+
+    def orientation(self, face):
+        return self.get(('orientation', entity_token(face)),
+                        lambda: face_orientation(face))
+
+    def frame(self, face):
+        return self.get(('frame', entity_token(face)),
+                        lambda: face_frame(face))
+
+    def dimensions(self, face):
+        return self.get(('dimensions', entity_token(face)),
+                        lambda: dimensions(face))
+
+    def distance(self, app, face, other):
+        return self.get(('distance', entity_token(face), entity_token(other)),
+                        lambda: distance_between_faces(app, face, other))
+
+    def classification(self, body):
+        return self.get(('classification',) + classification_key(body),
+                        lambda: FaceClassification(body))
+
+    def classify(self, body):
+        """ Classify the body's faces a slice at a time, for work that is
+            spread over idle time. Yields after each slice, and caches
+            the classification once it is complete.
+            """
+        key = ('classification',) + classification_key(body)
+        if key in self.entries:
+            return
+        for classification in FaceClassification.in_steps(body):
+            if classification is None:
+                yield
+        self.get(key, lambda: classification)
+
+    def is_edge(self, brepface):
+        return self.classification(brepface.body).is_edge(brepface)
+
+    def parallel(self, brepface, other):
+        """ Whether two faces are parallel, from the classification
+            when both faces are planar faces of the same body.
+            """
+        if brepface.body == other.body:
+            parallel = self.classification(brepface.body).parallel(brepface, other)
+            if parallel is not None:
+                return parallel
+        return brepface.geometry.isParallelToPlane(other.geometry)
+
+    def opposite(self, brepface):
+        """ The face opposite the given face in the same body, or None.
+            """
+        token = self.classification(brepface.body).opposite(brepface)
+        if token is None:
+            return None
+        found = brepface.body.parentComponent.parentDesign.findEntityByToken(token)
+        return found[0] if found else None
+
+    def topology(self, body):
+        return self.get(('topology',) + classification_key(body),
+                        lambda: Topology(body))
+
+    def perpendicular_edge(self, face, vertex):
+        return self.get(('perpendicular', entity_token(face), entity_token(vertex)),
+                        lambda: perpendicular_edge_from_vertex(face, vertex, self.topology(face.body)))
@@ -2,6 +2,7 @@ from .dimensions import dimensions
 from .distancebetween import distance_between
 from .distancebetween import distance_between_faces
 from .edgeonface import edge_on_face
+from .faceframe import face_frame
 from .faceorientation import face_orientation
 from .paralleltoedge import parallel_to_edge
 from .perpendicularedgefromvertex import perpendicular_edge_from_vertex, perpendicular_edge_from_line
@@ -12,6 +13,7 @@ __all__ = [
     distance_between,
     distance_between_faces,
     edge_on_face,
+    face_frame,
     face_orientation,
     parallel_to_edge,
     perpendicular_edge_from_line,
@@ -66,7 +66,7 @@ class Face:
         return parallel_to_edge(self.brepface, edge)
 
     def perpendicular_from_vertex(self, vertex):
-        return perpendicular_edge_from_vertex(self, vertex)
+        return perpendicular_edge_from_vertex(self.brepface, vertex)
 
     def mark_complete(self):
         self.brepface.attributes.add('tabgen', 'completed', str(1))
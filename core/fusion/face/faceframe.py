@@ -0,0 +1,39 @@
+from collections import namedtuple
+
+# origin: a corner of the face, at the start of its longest edge
+# direction: unit vector along the longest edge
+# across: unit vector along the edge that meets it at the origin
+# inward: unit vector into the body, opposite the face normal
+Frame = namedtuple('Frame', ['origin', 'direction', 'across', 'inward', 'length', 'width'])
+
+
+def _unit(start, end):
+    vector = start.vectorTo(end)
+    length = vector.length
+    vector.normalize()
+    return vector.asArray(), length
+
+
+def face_frame(brepface):
+    """ A coordinate frame in world space for a rectangular face, so
+        that positions along the face can be placed without creating a
+        sketch on it.
+        """
+    edges = sorted(brepface.edges, key=lambda edge: edge.length, reverse=True)
+    longest = edges[0]
+    start = longest.startVertex
+    direction, length = _unit(start.geometry, longest.endVertex.geometry)
+
+    across, width = (0, 0, 0), 0
+    for edge in edges[1:]:
+        if edge.startVertex == start:
+            across, width = _unit(start.geometry, edge.endVertex.geometry)
+            break
+        if edge.endVertex == start:
+            across, width = _unit(start.geometry, edge.startVertex.geometry)
+            break
+
+    _, normal = brepface.evaluator.getNormalAtPoint(brepface.pointOnFace)
+    inward = tuple(-value for value in normal.asArray())
+
+    return Frame(start.geometry.asArray(), direction, across, inward, length, width)
@@ -1,5 +1,7 @@
 from collections import namedtuple
 
+from ..body import Topology
+
 
 PerpendicularEdge = namedtuple('PerpendicularEdge', ['point', 'edge', 'other'])
 
@@ -7,9 +9,9 @@ PerpendicularEdge = namedtuple('PerpendicularEdge', ['point', 'edge', 'other'])
 class NoVertexError(Exception): pass
 
 
-def perpendicular_edge_from_vertex(brepface, vertex):
-    """ From a given vertex on the brepface, find the
-        perpendicular edge on a connected brepface.
+def _walk_vertex(brepface, vertex):
+    """ Find the perpendicular edge through the API, for a vertex that
+        isn't in the topology under its current token.
         """
     connected = vertex.edges
 
@@ -24,12 +26,30 @@ def perpendicular_edge_from_vertex(brepface, vertex):
             edge = testedge
             start = testedge.startVertex
             end = testedge.endVertex
-            if start == vertex:
-                other = end
+            other = end if start == vertex else start
 
     return PerpendicularEdge(vertex, edge, other)
 
 
+def perpendicular_edge_from_vertex(brepface, vertex, topology=None):
+    """ From a given vertex on the brepface, find the
+        perpendicular edge on a connected brepface.
+        """
+    topology = topology if topology is not None else Topology(brepface.body)
+    token = vertex.entityToken
+    connected = topology.vertex_edges.get(token)
+
+    if not connected:
+        return _walk_vertex(brepface, vertex)
+
+    found = topology.perpendicular(brepface, token)
+    if not found:
+        return PerpendicularEdge(vertex, None, topology.vertices[topology.edge_vertices[connected[0]][0]])
+
+    index = found[-1]
+    return PerpendicularEdge(vertex, topology.edges[index], topology.other_end(index, token))
+
+
 def edge_matches_points(edge, point1, point2):
     """ Find the face edge that matches the associated points.
         This can find the face edge that matches two points from
@@ -52,21 +72,15 @@ def edge_from_point(point, edge, reverse=False):
         if point.isEqualTo(edge.endVertex.geometry):
             return edge.startVertex if reverse else edge.endVertex
 
-def perpendicular_edge_from_line(brepface, spoint, rpoint, ui):
-    edges = brepface.edges
-
-    ui.messageBox('perp_edge_from_line: {}'.format(len(edges)))
-    for edge in edges:
-        if edge_matches_point(edge, spoint, rpoint):
-            continue
-
-        connected = edge_from_point(spoint, edge)
-        if not connected:
-            continue
+def perpendicular_edge_from_line(brepface, spoint, rpoint, ui=None, topology=None):
+    """ The edge perpendicular to the brepface at the start point of
+        the line from spoint to rpoint, which lies along a face edge.
+        """
+    topology = topology if topology is not None else Topology(brepface.body)
 
-        for vedge in connected.edges:
-            line = vedge.geometry
-            if brepface.geometry.isPerpendicularToLine(line):
-                return vedge
-    else:
+    token = topology.vertex_at(brepface, spoint)
+    if token is None:
         return None
+
+    found = topology.perpendicular(brepface, token)
+    return topology.edges[found[0]] if found else None
@@ -1,12 +1,46 @@
+from collections import namedtuple
+
 from ... import definitions as defs
-from ..face import dimensions
-from ..face import distance_between_faces
 
 from .inputreader import InputReader
 
+# name: the name of the derived value, which other values can depend on
+# depends: the input ids and derived values that it is computed from
+# update: the ChangedInputs method that recomputes it; values that
+#         depend on another derived value are only recomputed if its
+#         update returns True
+Derived = namedtuple('Derived', ['name', 'depends', 'update'])
+
+# In the order that they are recomputed
+DERIVED = (
+    Derived('finger_type', (defs.fingerTypeId,), 'update_finger_type'),
+    Derived('placement', (defs.fingerPlaceId,), 'finger_placement'),
+    Derived('opposite', (defs.selectedFaceInputId, defs.fingerPlaceId), 'find_opposite'),
+    Derived('focus', (defs.selectedFaceInputId, defs.dualEdgeSelectId,
+                      defs.fingerPlaceId, 'opposite'), 'update_focus'),
+    Derived('length', (defs.selectedFaceInputId,), 'update_length'),
+    Derived('distance', (defs.selectedFaceInputId, defs.dualEdgeSelectId,
+                         defs.fingerPlaceId, 'opposite'), 'update_distance'),
+)
+
 
 class ChangedInputs(InputReader):
 
+    def update(self, id_):
+        """ Recompute the derived values that depend on the changed
+            input, and nothing else. Returns the names of the values
+            that were recomputed.
+            """
+        changed = {id_}
+        updated = []
+        for derived in DERIVED:
+            if changed.isdisjoint(derived.depends):
+                continue
+            updated.append(derived.name)
+            if getattr(self, derived.update)():
+                changed.add(derived.name)
+        return updated
+
     def update_finger_type(self):
         if self.finger_type == defs.constantCountId:
             self.width.isVisible = False
@@ -24,18 +58,16 @@ class ChangedInputs(InputReader):
             self.width.isVisible = True
 
     def find_opposite(self):
+        """ Select the face opposite the selected face as the secondary
+            face. Returns True if a face was selected.
+            """
         if self.face_selected and not self.single_edge_selected:
-            plane = self.selected_face.geometry
-            body = self.selected_face.body
-            for alternate in body.faces:
-                if alternate == self.selected_face:
-                    continue
-                alternate_plane = alternate.geometry
-                if alternate_plane.isParallelToPlane(plane):
-                    if round(alternate.area, 3) == round(self.selected_face.area, 3):
-                        if self.edge.addSelection(alternate):
-                            self.edge_selected = self.edge.selectionCount > 0
-                            self.selected_edge = self.edge.selection(0).entity if self.edge_selected else None
+            alternate = self.cache.opposite(self.selected_face)
+            if alternate and self.edge.addSelection(alternate):
+                self.edge_selected = self.edge.selectionCount > 0
+                self.selected_edge = self.edge.selection(0).entity if self.edge_selected else None
+                return True
+        return False
 
     def finger_placement(self):
         if self.single_edge_selected:
@@ -52,12 +84,14 @@ class ChangedInputs(InputReader):
             self.distance.isVisible = True
             self.distance.isEnabled = True
 
-    def update_inputs(self):
+    def update_focus(self):
         if self.edge.isEnabled:
             self.edge.hasFocus = self.face_selected and not self.edge_selected
 
+    def update_length(self):
         self.length.value = self.length_value
 
+    def update_distance(self):
         if self.distance.isEnabled:
             self.distance.value = self.distance_value
 
@@ -66,13 +100,13 @@ class ChangedInputs(InputReader):
         if not self.selected_face:
             return 0
 
-        return dimensions(self.selected_face).length
+        return self.cache.dimensions(self.selected_face).length
 
     @property
     def distance_value(self):
         if not self.face_selected or not self.edge_selected:
             return 0
 
-        return distance_between_faces(self.app,
-                                      self.selected_face,
-                                      self.selected_edge)
+        return self.cache.distance(self.app,
+                                   self.selected_face,
+                                   self.selected_edge)
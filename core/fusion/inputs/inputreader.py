@@ -1,6 +1,12 @@
 from ... import definitions as defs
 
 from ... import managers
+from ..cache import entity_token
+from ..cache import SessionCache
+from .lazy import command_input
+from .lazy import input_value
+from .lazy import lazy
+from .lazy import selected_item
 
 create_properties = {
     defs.automaticWidthId: managers.create_auto_width,
@@ -10,45 +16,83 @@ create_properties = {
 
 
 class InputReader:
-
-    def __init__(self, app, inputs, preview=False):
+    """ The values of the command inputs during one event. Each input
+        is only looked up when a handler first uses it, so an event
+        costs only the API calls for what it reads.
+        """
+
+    placement = selected_item(defs.fingerPlaceId)
+    face = command_input(defs.selectedFaceInputId)
+    edge = command_input(defs.dualEdgeSelectId)
+    reference_edges = command_input(defs.referenceSelectId)
+    length = command_input(defs.lengthInputId)
+    distance = command_input(defs.distanceInputId)
+    depth = command_input(defs.mtlThickInputId)
+    margin = command_input(defs.marginInputId)
+    edge_margin = command_input(defs.edgeMarginInputId)
+    width = command_input(defs.tabWidthInputId)
+    kerf = command_input(defs.kerfInputId)
+    interior = command_input(defs.wallCountInputId)
+    finger_count = command_input(defs.tabCountInputId)
+    tab_first = input_value(defs.startWithTabInputId)
+    finger_type = selected_item(defs.fingerTypeId)
+    parametric = input_value(defs.parametricInputId)
+    preview_enabled = input_value(defs.previewInputId)
+    preview_mode = selected_item(defs.previewModeId)
+    err = command_input(defs.ERROR_MSG_INPUT_ID)
+    preview_level = command_input(defs.previewLevelId)
+
+    def __init__(self, app, inputs, preview=False, cache=None):
         self.app = app
-        self.placement = inputs.itemById(defs.fingerPlaceId).selectedItem.name
-        self.face = inputs.itemById(defs.selectedFaceInputId)
-        self.edge = inputs.itemById(defs.dualEdgeSelectId)
-        self.reference_edges = inputs.itemById(defs.referenceSelectId)
-        self.length = inputs.itemById(defs.lengthInputId)
-        self.distance = inputs.itemById(defs.distanceInputId)
-        self.depth = inputs.itemById(defs.mtlThickInputId)
-        self.margin = inputs.itemById(defs.marginInputId)
-        self.edge_margin = inputs.itemById(defs.edgeMarginInputId)
-        self.width = inputs.itemById(defs.tabWidthInputId)
-        self.kerf = inputs.itemById(defs.kerfInputId)
-        self.interior = inputs.itemById(defs.wallCountInputId)
-        self.finger_count = inputs.itemById(defs.tabCountInputId)
-        self.tab_first = inputs.itemById(defs.startWithTabInputId).value
-        self.finger_type = inputs.itemById(defs.fingerTypeId).selectedItem.name
-        self.parametric = inputs.itemById(defs.parametricInputId).value
-        self.preview_enabled = inputs.itemById(defs.previewInputId).value
-        self.err = inputs.itemById(defs.ERROR_MSG_INPUT_ID)
+        self.inputs = inputs
+        self.cache = cache if cache is not None else SessionCache()
         self.preview = preview
 
-        self.face_selected = self.face.selectionCount > 0
-        self.selected_face = self.face.selection(0).entity if self.face_selected else None
+    @lazy
+    def face_selected(self):
+        return self.face.selectionCount > 0
+
+    @lazy
+    def selected_face(self):
+        return self.face.selection(0).entity if self.face_selected else None
 
-        self.selected_body = self.selected_face.body if self.selected_face else None
+    @lazy
+    def selected_body(self):
+        return self.selected_face.body if self.selected_face else None
 
-        self.edge_selected = self.edge.selectionCount > 0
-        self.selected_edge = self.edge.selection(0).entity if self.edge_selected else None
+    @lazy
+    def edge_selected(self):
+        return self.edge.selectionCount > 0
+
+    @lazy
+    def selected_edge(self):
+        return self.edge.selection(0).entity if self.edge_selected else None
 
     @property
     def name(self):
         return self.selected_body.name
 
+    @property
+    def fingerprint(self):
+        """ The selections and input values that the finger properties
+            are computed from.
+            """
+        values = tuple((getattr(input_, 'expression', None), input_.value)
+                       for input_ in (self.length, self.distance, self.depth, self.margin,
+                                      self.edge_margin, self.width, self.kerf, self.interior,
+                                      self.finger_count))
+        return (self.finger_type, self.placement, self.tab_first, self.parametric,
+                self.preview_enabled, entity_token(self.selected_face),
+                entity_token(self.selected_edge)) + values
+
     @property
     def dual_edge_selected(self):
         return not self.single_edge_selected
 
+    @property
+    def graphics_preview(self):
+        return self.preview_mode == defs.previewGraphicsId
+
     @property
     def single_edge_selected(self):
         return self.placement == defs.singleEdgeId
@@ -70,7 +114,7 @@ class InputReader:
         if not self.face_selected:
             return True
 
-        return self.selected_face.geometry.isParallelToPlane(edge.geometry)
+        return self.cache.parallel(self.selected_face, edge)
 
     def edge_parallel_to_face(self, face):
         if not self.edge_selected:
@@ -97,4 +141,10 @@ class InputReader:
         return True
 
     def create_properties(self, app, ui):
-        return create_properties[self.finger_type](app, ui, self)
\ No newline at end of file
+        create = create_properties[self.finger_type]
+
+        # Creating the properties numbers the face, which has to be
+        # done again when the command is executed.
+        if not self.preview:
+            return create(app, ui, self)
+        return self.cache.get(('properties',) + self.fingerprint, lambda: create(app, ui, self))
\ No newline at end of file
@@ -0,0 +1,35 @@
+class lazy:
+    """ A property that is computed the first time it is read, and
+        then kept on the instance. Assigning to it replaces the value.
+        """
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.name] = value
+        return value
+
+
+def command_input(id_):
+    """ A command input, looked up by id the first time it is used.
+        """
+    return lazy(lambda self: self.inputs.itemById(id_))
+
+
+def input_value(id_):
+    return lazy(lambda self: self.inputs.itemById(id_).value)
+
+
+def selected_item(id_):
+    """ The name of the selected item of a dropdown input.
+        """
+    return lazy(lambda self: self.inputs.itemById(id_).selectedItem.name)
@@ -9,6 +9,9 @@ from adsk.fusion import SketchLine
 Point = namedtuple('Point', ['point', 'vertex', 'geometry'])
 
 
+def x_reversed(start, end):
+    return not (start.x >= 0 and end.x >= 0 and end.x >= start.x)
+
 def x_direction(start, end):
     return 1 if not x_reversed(start, end) else -1
 
@@ -35,14 +38,42 @@ def reversed(vertical, line):
         return sg.x >= eg.x
 
 
-class Line:
+class Segment:
+    """ The coordinates of a sketch line, read from the API once. The
+        orientation of the borders and fingers is worked out from these
+        instead of the sketch points.
+        """
+
+    __slots__ = ('start', 'end', 'start_geometry', 'end_geometry', 'length')
 
     def __init__(self, line):
+        self.start_geometry = line.startSketchPoint.geometry
+        self.end_geometry = line.endSketchPoint.geometry
+        self.start = (self.start_geometry.x, self.start_geometry.y)
+        self.end = (self.end_geometry.x, self.end_geometry.y)
+        self.length = line.length
+
+    @property
+    def is_vertical(self):
+        return round(self.start[0], 5) == round(self.end[0], 5)
+
+    @property
+    def changes_y(self):
+        return self.start[1] != self.end[1]
+
+
+class Line:
+
+    __slots__ = ('line', 'segment', 'is_vertical', 'length', 'edge',
+                 'start_vertex', 'end_vertex', 'reversed',
+                 'start_point', 'end_point', 'start', 'end')
+
+    def __init__(self, line, segment=None):
         self.line = line
+        self.segment = segment if segment is not None else Segment(line)
 
-        self.is_vertical = (round(self.line.startSketchPoint.geometry.x, 5) ==
-                            round(self.line.endSketchPoint.geometry.x, 5))
-        self.length = self.line.length
+        self.is_vertical = self.segment.is_vertical
+        self.length = self.segment.length
 
         if self.line.isReference:
             self.edge = self.line.referencedEntity
@@ -61,16 +92,20 @@ class Line:
             self.start_vertex = None
             self.end_vertex = None
 
+        sg = self.segment.start
+        eg = self.segment.end
+        self.reversed = eg[1] < sg[1] if self.is_vertical else sg[0] > eg[0]
+
         self.start_point = self.line.startSketchPoint if not self.reversed else self.line.endSketchPoint
         self.end_point = self.line.endSketchPoint if not self.reversed else self.line.startSketchPoint
 
         self.end = Point(self.end_point,
                          self.end_vertex if not self.reversed else self.start_vertex,
-                         self.end_point.geometry)
+                         self.segment.end_geometry if not self.reversed else self.segment.start_geometry)
 
         self.start = Point(self.start_point,
-                           self.start_vertex  if not self.reversed else self.end_vertex,
-                           self.start_point.geometry)
+                           self.start_vertex if not self.reversed else self.end_vertex,
+                           self.segment.start_geometry if not self.reversed else self.segment.end_geometry)
 
     def find_reference(self, line, face):
         line_start = line.startSketchPoint.worldGeometry
@@ -85,23 +120,13 @@ class Line:
 
     @property
     def direction(self):
-        spg = self.start_geometry
-        epg = self.end_geometry
-        return direction(spg, epg, self.is_vertical)
-
-    @property
-    def reversed(self):
-        sg = self.line.startSketchPoint.geometry
-        eg = self.line.endSketchPoint.geometry
-
-        if self.is_vertical:
-            return eg.y < sg.y
-        else:
-            return sg.x > eg.x
+        return direction(self.start.geometry, self.end.geometry, self.is_vertical)
 
 
 class Top(Line):
 
+    __slots__ = ()
+
     @property
     def left(self):
         return self.start
@@ -110,18 +135,11 @@ class Top(Line):
     def right(self):
         return self.end
 
-    @property
-    def reversed(self):
-        sg = self.line.startSketchPoint.geometry
-        eg = self.line.endSketchPoint.geometry
-
-        if self.is_vertical:
-            return eg.y < sg.y
-        else:
-            return eg.x < sg.x
 
 class Bottom(Line):
 
+    __slots__ = ()
+
     @property
     def left(self):
         return self.start
@@ -130,19 +148,12 @@ class Bottom(Line):
     def right(self):
         return self.end
 
-    @property
-    def reversed(self):
-        sg = self.line.startSketchPoint.geometry
-        eg = self.line.endSketchPoint.geometry
-
-        if self.is_vertical:
-            return eg.y < sg.y
-        else:
-            return eg.x < sg.x
 
 class Left(Bottom):
-    pass
+
+    __slots__ = ()
 
 
 class Right(Top):
-    pass
+
+    __slots__ = ()
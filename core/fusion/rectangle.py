@@ -3,8 +3,7 @@ from collections import namedtuple
 from adsk.core import Point3D
 from adsk.fusion import DimensionOrientations
 
-from .util import vertical
-
+from .line import Segment
 from .line import Top, Bottom, Left, Right
 
 
@@ -12,39 +11,37 @@ ReferencePoint = namedtuple('ReferencePoint', ['first', 'second'])
 
 
 def compare_lines(first, second, func, reverse):
-    sp1 = first.startSketchPoint.geometry
-    sp2 = second.startSketchPoint.geometry
-    ep1 = first.endSketchPoint.geometry
-    ep2 = second.endSketchPoint.geometry
-
-    points = [sp1, sp2, ep1, ep2]
-    point = sorted(points, key=func, reverse=reverse)[0]
-
-    if point == sp1 or point == ep1:
-        return first
-    return second
+    points = [(first.start, first), (second.start, second),
+              (first.end, first), (second.end, second)]
+    return sorted(points, key=lambda item: func(item[0]), reverse=reverse)[0][1]
 
 
 def bottom_line(axes):
-    return compare_lines(axes[0], axes[1], lambda k: k.y, False)
+    return compare_lines(axes[0], axes[1], lambda k: k[1], False)
 
 
 def left_line(axes):
-    return compare_lines(axes[0], axes[1], lambda k: k.x, False)
+    return compare_lines(axes[0], axes[1], lambda k: k[0], False)
 
 
 def right_line(axes):
-    return compare_lines(axes[0], axes[1], lambda k: k.x, True)
+    return compare_lines(axes[0], axes[1], lambda k: k[0], True)
 
 
 def top_line(axes):
-    return compare_lines(axes[0], axes[1], lambda k: k.y, True)
+    return compare_lines(axes[0], axes[1], lambda k: k[1], True)
 
 
 class InvalidLinesError(Exception): pass
 
 
 class Rectangle:
+    """ The border lines of a rectangle, classified once from snapshots
+        of their coordinates.
+        """
+
+    __slots__ = ('lines', 'segments', 'width', 'length', 'length_axes', 'width_axes',
+                 'top', 'bottom', 'left', 'right', 'is_vertical')
 
     def __init__(self, lines):
         super().__init__()
@@ -54,51 +51,49 @@ class Rectangle:
         if len(self.lines) < 4:
             raise InvalidLinesError
 
+        self.segments = [Segment(self.lines[index]) for index in range(4)]
         self.__set_width_length(self.lines)
         self.__set_axes()
 
+        self.is_vertical = self.left.length == self.length
+
     def __set_axes(self):
-        is_vertical = vertical(self.length_axes[0])
+        # A line is never equal to a length, so the length axes are
+        # always the second and fourth lines.
+        if self.lines[0] == self.length:
+            length_axes, width_axes = (0, 2), (1, 3)
+        else:
+            length_axes, width_axes = (1, 3), (0, 2)
+        self.length_axes = tuple(self.lines[index] for index in length_axes)
+        self.width_axes = tuple(self.lines[index] for index in width_axes)
+
+        is_vertical = self.segments[length_axes[0]].changes_y
 
         if is_vertical is True:
-            tbaxes = self.width_axes
-            lraxes = self.length_axes
+            tbaxes = width_axes
+            lraxes = length_axes
         else:
-            tbaxes = self.length_axes
-            lraxes = self.width_axes
+            tbaxes = length_axes
+            lraxes = width_axes
+
+        self.top = self.__line(Top, top_line, tbaxes)
+        self.bottom = self.__line(Bottom, bottom_line, tbaxes)
+        self.left = self.__line(Left, left_line, lraxes)
+        self.right = self.__line(Right, right_line, lraxes)
 
-        self.top = Top(top_line(tbaxes))
-        self.bottom = Bottom(bottom_line(tbaxes))
-        self.left = Left(left_line(lraxes))
-        self.right = Right(right_line(lraxes))
+    def __line(self, cls, choose, axes):
+        first, second = (self.segments[index] for index in axes)
+        segment = choose((first, second))
+        index = axes[0] if segment is first else axes[1]
+        return cls(self.lines[index], segment)
 
     def __set_width_length(self, lines):
-        lline1 = lines[0]
-        lline2 = lines[1]
+        lline1 = self.segments[0]
+        lline2 = self.segments[1]
 
         self.width = min(lline1.length, lline2.length)
         self.length = max(lline1.length, lline2.length)
 
-    @property
-    def length_axes(self):
-        if self.lines[0] == self.length:
-            return (self.lines[0],
-                    self.lines[2])
-        return (self.lines[1],
-                self.lines[3])
-
-    @property
-    def width_axes(self):
-        if self.lines[0] == self.length:
-            return (self.lines[1],
-                    self.lines[3])
-        return (self.lines[0],
-                self.lines[2])
-
-    @property
-    def is_vertical(self):
-        return self.left.length == self.length
-
     @property
     def reference_points(self):
         if self.is_vertical:
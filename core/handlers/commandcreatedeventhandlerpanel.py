@@ -6,9 +6,14 @@ from adsk.core import CommandCreatedEventHandler
 from adsk.core import DropDownStyles as dds
 
 from .. import definitions as defs
+from .. import fusion
+from ..layout import units as length_units
+from .commanddestroyhandler import CommandDestroyHandler
 from .commandexecutehandler import CommandExecuteHandler
 from .commandexecutepreviewhandler import CommandExecutePreviewHandler
 from .inputchangedhandler import InputChangedHandler
+from .precompute import Precompute
+from .previewscheduler import PreviewScheduler
 from .selectioneventhandler import SelectionEventHandler
 from .validateinputshandler import ValidateInputsHandler
 
@@ -24,8 +29,22 @@ class CommandCreatedEventHandlerPanel(CommandCreatedEventHandler):
         self.app = config.app
         self.ui = config.ui
         self.config = config
+        # The handlers of the open command; Fusion only keeps weak
+        # references to them, and they are released when it closes.
         self.handlers = []
 
+    def release(self):
+        self.handlers.clear()
+
+    def convert(self, value, from_units, to_units):
+        """ Convert lengths locally; only units that TabGen doesn't
+            know about are converted by Fusion.
+            """
+        try:
+            return length_units.convert(value, from_units, to_units)
+        except length_units.UnknownUnits:
+            return self.app.activeProduct.unitsManager.convert(value, from_units, to_units)
+
     def add_dropdown(self, inputs, id_, name, items):
         input_ = inputs.addDropDownCommandInput(id_,
                                                 name,
@@ -64,31 +83,45 @@ class CommandCreatedEventHandlerPanel(CommandCreatedEventHandler):
                 # cmd.helpFile = 'resources/help.html'
                 cmd.helpFile = self.config.help_file
 
+                # Handlers from a command that wasn't destroyed cleanly
+                self.release()
+
+                # The selection analysis is shared by the handlers for as
+                # long as this dialog is open.
+                cache = fusion.SessionCache()
+                scheduler = PreviewScheduler(self.app, self.ui, cmd, self.config.PREVIEW_DEBOUNCE_INTERVAL)
+                precompute = Precompute(self.app, self.ui, cmd, cache)
+
                 # Add onExecute event handler
-                execute = CommandExecuteHandler(self.config)
+                execute = CommandExecuteHandler(self.config, cache)
                 cmd.execute.add(execute)
                 self.handlers.append(execute)
 
                 # Add onExecute event handler
-                execute_preview = CommandExecutePreviewHandler(self.config)
+                execute_preview = CommandExecutePreviewHandler(self.config, cache, scheduler, precompute)
                 cmd.executePreview.add(execute_preview)
                 self.handlers.append(execute_preview)
 
                 # Add onInputChanged handler
-                changed = InputChangedHandler(self.app, self.ui)
+                changed = InputChangedHandler(self.app, self.ui, cache, scheduler, precompute)
                 cmd.inputChanged.add(changed)
                 self.handlers.append(changed)
 
-                # # Add onValidateInputs event handler
-                # validate = ValidateInputsHandler(self.app, self.ui)
-                # cmd.validateInputs.add(validate)
-                # self.handlers.append(validate)
+                # Add onValidateInputs event handler
+                validate = ValidateInputsHandler(self.config, cache)
+                cmd.validateInputs.add(validate)
+                self.handlers.append(validate)
 
                 # Add SelectionEvent handler
-                selection = SelectionEventHandler(self.app, self.ui)
+                selection = SelectionEventHandler(self.app, self.ui, cache)
                 cmd.selectionEvent.add(selection)
                 self.handlers.append(selection)
 
+                # Add onDestroy handler
+                destroy = CommandDestroyHandler(self, cache, scheduler, precompute)
+                cmd.destroy.add(destroy)
+                self.handlers.append(destroy)
+
                 # Set up the inputs
                 cmd_inputs = cmd.commandInputs
 
@@ -125,21 +158,21 @@ class CommandCreatedEventHandlerPanel(CommandCreatedEventHandler):
                     defs.tabWidthInputId,
                     'Tab Width',
                     units,
-                    units_manager.convert(2.0, 'mm', units) if metric else units_manager.convert(.0625, 'in', units),
-                    units_manager.convert(2500.0, 'mm', units) if metric else units_manager.convert(24, 'in', units),
-                    units_manager.convert(0.1, 'mm', units) if metric else units_manager.convert(.125, 'in', units),
-                    units_manager.convert(self.config.DEFAULT_TAB_WIDTH,
-                                          'mm', units) if metric else units_manager.convert(.125, 'in', units)
+                    self.convert(2.0, 'mm', units) if metric else self.convert(.0625, 'in', units),
+                    self.convert(2500.0, 'mm', units) if metric else self.convert(24, 'in', units),
+                    self.convert(0.1, 'mm', units) if metric else self.convert(.125, 'in', units),
+                    self.convert(self.config.DEFAULT_TAB_WIDTH,
+                                 'mm', units) if metric else self.convert(.125, 'in', units)
                     )
                 inputs.addFloatSpinnerCommandInput(
                     defs.mtlThickInputId,
                     'Tab Depth',
                     units,
-                    units_manager.convert(0.5, 'mm', units) if metric else units_manager.convert(.005, 'in', units),
-                    units_manager.convert(102.0, 'mm', units) if metric else units_manager.convert(4, 'in', units),
-                    units_manager.convert(0.1, 'mm', units) if metric else units_manager.convert(.125, 'in', units),
-                    units_manager.convert(self.config.DEFAULT_MATERIAL_THICKNESS,
-                                          'mm', units) if metric else units_manager.convert(.125, 'in', units)
+                    self.convert(0.5, 'mm', units) if metric else self.convert(.005, 'in', units),
+                    self.convert(102.0, 'mm', units) if metric else self.convert(4, 'in', units),
+                    self.convert(0.1, 'mm', units) if metric else self.convert(.125, 'in', units),
+                    self.convert(self.config.DEFAULT_MATERIAL_THICKNESS,
+                                 'mm', units) if metric else self.convert(.125, 'in', units)
                     )
 
                 inputs.addBoolValueInput(defs.startWithTabInputId,
@@ -150,17 +183,17 @@ class CommandCreatedEventHandlerPanel(CommandCreatedEventHandler):
                 inputs.addFloatSpinnerCommandInput(defs.lengthInputId,
                                                    'Face Length',
                                                    units,
-                                                   units_manager.convert(0, 'mm', units),
-                                                   units_manager.convert(2500.0, 'mm', units),
-                                                   units_manager.convert(0.1, 'mm', units),
-                                                   units_manager.convert(0.0, 'mm', units))
+                                                   self.convert(0, 'mm', units),
+                                                   self.convert(2500.0, 'mm', units),
+                                                   self.convert(0.1, 'mm', units),
+                                                   self.convert(0.0, 'mm', units))
                 inputs.addFloatSpinnerCommandInput(defs.distanceInputId,
                                                    'Duplicate Distance',
                                                    units,
-                                                   units_manager.convert(0, 'mm', units),
-                                                   units_manager.convert(2500.0, 'mm', units),
-                                                   units_manager.convert(0.1, 'mm', units),
-                                                   units_manager.convert(0.0, 'mm', units))
+                                                   self.convert(0, 'mm', units),
+                                                   self.convert(2500.0, 'mm', units),
+                                                   self.convert(0.1, 'mm', units),
+                                                   self.convert(0.0, 'mm', units))
 
                 inputs.addTextBoxCommandInput(defs.ERROR_MSG_INPUT_ID,
                                               '',
@@ -178,6 +211,16 @@ class CommandCreatedEventHandlerPanel(CommandCreatedEventHandler):
                                          True,
                                          '',
                                          self.config.DEFAULT_ENABLE_PREVIEW)
+                self.add_dropdown(inputs, defs.previewModeId, 'Preview Mode', [Item(defs.previewFeaturesId,
+                                                                                    self.config.DEFAULT_PREVIEW_FEATURES),
+                                                                               Item(defs.previewGraphicsId,
+                                                                                    self.config.DEFAULT_PREVIEW_GRAPHICS)
+                                                                               ])
+                inputs.addTextBoxCommandInput(defs.previewLevelId,
+                                              'Preview Detail',
+                                              '',
+                                              1,
+                                              True)
 
                 tab_inputs = cmd_inputs.addTabCommandInput(defs.advancedTabId, 'Advanced').children
 
@@ -188,30 +231,30 @@ class CommandCreatedEventHandlerPanel(CommandCreatedEventHandler):
                     defs.marginInputId,
                     'Margin from Sides',
                     units,
-                    units_manager.convert(0, 'mm', units),
-                    units_manager.convert(2500, 'mm', units),
-                    units_manager.convert(0.1, 'mm', units),
-                    units_manager.convert(self.config.DEFAULT_MARGIN_WIDTH, 'mm', units)
+                    self.convert(0, 'mm', units),
+                    self.convert(2500, 'mm', units),
+                    self.convert(0.1, 'mm', units),
+                    self.convert(self.config.DEFAULT_MARGIN_WIDTH, 'mm', units)
                     )
 
                 tab_inputs.addFloatSpinnerCommandInput(
                     defs.edgeMarginInputId,
                     'Margin from Edge',
                     units,
-                    units_manager.convert(0, 'mm', units),
-                    units_manager.convert(2500, 'mm', units),
-                    units_manager.convert(0.1, 'mm', units),
-                    units_manager.convert(self.config.DEFAULT_MARGIN_WIDTH, 'mm', units)
+                    self.convert(0, 'mm', units),
+                    self.convert(2500, 'mm', units),
+                    self.convert(0.1, 'mm', units),
+                    self.convert(self.config.DEFAULT_MARGIN_WIDTH, 'mm', units)
                     )
 
                 tab_inputs.addFloatSpinnerCommandInput(
                     defs.kerfInputId,
                     'Kerf Adjustment',
                     units,
-                    units_manager.convert(0, 'mm', units),
-                    units_manager.convert(50.8, 'mm', units),
-                    units_manager.convert(0.1, 'mm', units),
-                    units_manager.convert(self.config.DEFAULT_KERF_WIDTH, 'mm', units)
+                    self.convert(0, 'mm', units),
+                    self.convert(50.8, 'mm', units),
+                    self.convert(0.1, 'mm', units),
+                    self.convert(self.config.DEFAULT_KERF_WIDTH, 'mm', units)
                     )
 
         except:
@@ -0,0 +1,34 @@
+import traceback
+
+from adsk.core import CommandEventHandler
+
+from .. import managers
+
+# Constants
+destroyFailedMsg = 'TabGen command cleanup failed: {}'
+
+
+class CommandDestroyHandler(CommandEventHandler):
+    """ Releases everything that was created for the command when its
+        dialog closes, whether it was executed or cancelled.
+        """
+
+    def __init__(self, panel, cache, scheduler, precompute):
+        super().__init__()
+        self.panel = panel
+        self.cache = cache
+        self.scheduler = scheduler
+        self.precompute = precompute
+        self.ui = panel.ui
+
+    def notify(self, args):
+        try:
+            self.scheduler.stop()
+            self.precompute.stop()
+
+            managers.graphics.clear(self.cache)
+            self.cache.clear()
+        except:
+            self.ui.messageBox(destroyFailedMsg.format(traceback.format_exc(3)))
+        finally:
+            self.panel.release()
@@ -1,19 +1,28 @@
 import traceback
 
 from adsk.core import CommandEventHandler
+from adsk.core import DialogResults
+from adsk.core import MessageBoxButtonTypes
+from adsk.core import MessageBoxIconTypes
 
 from .. import fusion
 from .. import managers
+from ..layout import cost
+from ..layout.evaluator import ExpressionError
 
 # Constants
 executionFailedMsg = 'TabGen executon failed: {}'
+invalidParametersMsg = 'TabGen parameters are invalid:\n{}'
+tooLargeMsg = 'TabGen will not create the fingers, they would be too large: {}'
+largeWarningMsg = 'The fingers will be slow to create: {}\n\nContinue?'
 
 
 class CommandExecuteHandler(CommandEventHandler):
 
-    def __init__(self, config):
+    def __init__(self, config, cache):
         super().__init__()
         self.config = config
+        self.cache = cache
         self.ui = self.config.ui
         self.app = self.config.app
 
@@ -23,14 +32,37 @@ class CommandExecuteHandler(CommandEventHandler):
         try:
             first_inputs = command.commandInputs
             parent_inputs = first_inputs.command.commandInputs if first_inputs.command else first_inputs
-            inputs = fusion.InputReader(self.app, parent_inputs)
-            properties = inputs.create_properties(self.app, self.ui)
+            inputs = fusion.InputReader(self.app, parent_inputs, cache=self.cache)
+
+            managers.graphics.clear(self.cache)
 
             if inputs.face_selected:
+                # Checked from the input values, since creating the
+                # properties numbers the face in the document.
+                estimate = managers.plan_estimate(inputs, managers.plan_layout(inputs))
+
+                too_large = cost.exceeds(estimate, self.config.MAX_INSTANCES)
+                if too_large:
+                    self.ui.messageBox(tooLargeMsg.format(', '.join(too_large)))
+                    return
+
+                slow = cost.exceeds(estimate, self.config.WARN_INSTANCES)
+                if slow and self.ui.messageBox(largeWarningMsg.format(', '.join(slow)), 'TabGen',
+                                               MessageBoxButtonTypes.YesNoButtonType,
+                                               MessageBoxIconTypes.WarningIconType) != DialogResults.DialogYes:
+                    return
+
+                properties = inputs.create_properties(self.app, self.ui)
                 managers.create(inputs, properties, preview=False)
             else:
                 self.ui.messageBox('No face was selected for placing fingers.')
 
+        except ExpressionError as err:
+            self.ui.messageBox(invalidParametersMsg.format(err))
+
+        except managers.CornerConflict as err:
+            self.ui.messageBox(str(err))
+
         except:
 
             self.ui.messageBox(executionFailedMsg.format(traceback.format_exc()))
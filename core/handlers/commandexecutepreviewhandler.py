@@ -4,42 +4,109 @@ from adsk.core import CommandEventHandler
 
 from .. import fusion
 from .. import managers
+from ..layout import cost
+from ..layout.evaluator import ExpressionError
 
 # Constants
 executionFailedMsg = 'TabGen executon failed: {}'
+invalidParametersMsg = 'Invalid parameters:\n{}'
+previewSkippedMsg = 'Preview skipped, the fingers are too large to preview: {}'
+
+previewLevels = {
+    cost.FULL: 'Complete',
+    cost.TRUNCATED: 'Reduced: first {notches} notches on each face',
+    cost.PRIMARY_ONLY: 'Reduced: first {notches} notches on the primary face only'
+}
 
 
 class CommandExecutePreviewHandler(CommandEventHandler):
 
-    def __init__(self, config):
+    def __init__(self, config, cache, scheduler, precompute):
         super().__init__()
         self.config = config
+        self.cache = cache
+        self.scheduler = scheduler
+        self.precompute = precompute
         self.ui = self.config.ui
         self.app = self.config.app
 
+    def within_limits(self, inputs):
+        """ Whether execute would create the fingers without asking,
+            checked against the planned layout.
+            """
+        estimate = managers.plan_estimate(inputs, managers.plan_layout(inputs))
+        return not (cost.exceeds(estimate, self.config.WARN_INSTANCES) or
+                    cost.exceeds(estimate, self.config.MAX_INSTANCES))
+
     def notify(self, args):
         command = args.firingEvent.sender
 
+        # The preview is requested again once the inputs stop changing,
+        # and once the selected faces have been analysed
+        if self.scheduler.pending or self.precompute.pending:
+            args.isValidResult = False
+            return
+
         try:
             first_inputs = command.commandInputs
             parent_inputs = first_inputs.command.commandInputs if first_inputs.command else first_inputs
-            inputs = fusion.InputReader(self.app, parent_inputs)
-            properties = inputs.create_properties(self.app, self.ui)
+            inputs = fusion.InputReader(self.app, parent_inputs, preview=True, cache=self.cache)
+            inputs.err.formattedText = ''
+            inputs.preview_level.formattedText = ''
+
+            managers.graphics.clear(self.cache)
 
-            if inputs.preview_enabled:
+            ready = inputs.face_selected and (inputs.single_edge_selected or inputs.edge_selected)
 
-                if inputs.dual_edge_selected and inputs.face_selected and inputs.edge_selected:
-                    managers.create(inputs, properties, preview=True)
-                elif inputs.single_edge_selected and inputs.face_selected:
-                    managers.create(inputs, properties, preview=True)
+            if inputs.preview_enabled and inputs.graphics_preview:
+                if ready:
+                    managers.graphics.draw(self.app, inputs, inputs.create_properties(self.app, self.ui))
 
-                if inputs.parametric:
-                    args.isValidResult = True
-                else:
-                    args.isValidResult = False
+                # Nothing was created that could be kept
+                args.isValidResult = False
+                return
+
+            if inputs.preview_enabled and inputs.face_selected:
+                fidelity = managers.preview_fidelity(inputs, self.config.PREVIEW_MAX_INSTANCES)
             else:
+                fidelity = cost.Fidelity(cost.FULL, 0, True)
+
+            if fidelity is None:
+                too_large = cost.exceeds(managers.plan_estimate(inputs, managers.plan_layout(inputs)),
+                                         self.config.PREVIEW_MAX_INSTANCES)
+                inputs.err.formattedText = previewSkippedMsg.format(', '.join(too_large))
                 args.isValidResult = False
 
+            elif inputs.preview_enabled:
+                if inputs.face_selected:
+                    inputs.preview_level.formattedText = previewLevels[fidelity.level].format(**fidelity._asdict())
+                reduced = fidelity if fidelity.level != cost.FULL else None
+
+                # A complete preview is built the same way that execute
+                # builds it, with the face numbered and the parameters
+                # bound, so that it can be kept as the result. A reduced
+                # preview can't be kept, and neither can one that
+                # execute would refuse or ask about, since a kept
+                # preview skips execute.
+                keep = ready and not reduced and self.within_limits(inputs)
+
+                if ready:
+                    inputs.preview = not keep
+                    properties = inputs.create_properties(self.app, self.ui)
+                    managers.create(inputs, properties, preview=not keep, fidelity=reduced)
+
+                args.isValidResult = keep
+            else:
+                args.isValidResult = False
+
+        except ExpressionError as err:
+            inputs.err.formattedText = invalidParametersMsg.format(err)
+            args.isValidResult = False
+
+        except managers.CornerConflict as err:
+            inputs.err.formattedText = str(err)
+            args.isValidResult = False
+
         except:
 
             self.ui.messageBox(executionFailedMsg.format(traceback.format_exc()))
@@ -15,34 +15,34 @@ class InputChangeValidationError(Exception): pass
 
 class InputChangedHandler(InputChangedEventHandler):
 
-    def __init__(self, app, ui):
+    def __init__(self, app, ui, cache, scheduler, precompute):
         super().__init__()
         self.app = app
         self.ui = ui
+        self.cache = cache
+        self.scheduler = scheduler
+        self.precompute = precompute
 
     def notify(self, args):
         try:
             cmd_input = args.input
             first_inputs = args.inputs
             parent_inputs = args.inputs.command.commandInputs if args.inputs.command else first_inputs
-            inputs = fusion.ChangedInputs(self.app, parent_inputs)
+            inputs = fusion.ChangedInputs(self.app, parent_inputs, cache=self.cache)
 
             id_ = cmd_input.id
 
-            if id_ == defs.fingerTypeId:
-                inputs.update_finger_type()
+            if self.scheduler.debounces(id_):
+                self.scheduler.schedule()
+            else:
+                self.scheduler.cancel()
 
-            if id_ == defs.fingerPlaceId:
-                inputs.finger_placement()
+            inputs.update(id_)
 
-            if id_ == defs.selectedFaceInputId or id_ == defs.fingerPlaceId:
-                inputs.find_opposite()
-
-            if id_ in [defs.selectedFaceInputId,
-                       defs.dualEdgeSelectId,
-                       defs.fingerPlaceId
-                       ]:
-                inputs.update_inputs()
+            if id_ in (defs.selectedFaceInputId, defs.dualEdgeSelectId):
+                self.precompute.start(inputs.selected_face,
+                                      inputs.selected_edge,
+                                      dual=not inputs.single_edge_selected)
 
         except:
             self.ui.messageBox(traceback.format_exc(3))
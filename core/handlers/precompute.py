@@ -0,0 +1,130 @@
+""" Analyse the selected faces while Fusion is idle, before the first
+    preview of them is built.
+
+    Once a face is selected, its dimensions, orientation, frame, the
+    classification of its body's faces, the edges used as pattern axes,
+    the opposite face and the distance to it are all needed by the
+    preview. The analysis is split into small steps; one step runs for
+    every custom event, and the next event is fired once it finishes,
+    so Fusion handles the user's input in between.
+
+    The preview handler skips building anything while the analysis is
+    pending, so the steps run against the same design that the preview
+    reads -- with no preview features in the timeline -- and the entries
+    they store in the session cache are the ones the preview looks up.
+    The preview is requested again once the last step has run.
+    Selecting another face drops the steps that are still pending.
+    """
+import traceback
+
+from adsk.core import CustomEventHandler
+
+PRECOMPUTE_EVENT_ID = 'tabGenPrecompute'
+
+precomputeFailedMsg = 'TabGen precompute failed: {}'
+
+
+class PrecomputeEventHandler(CustomEventHandler):
+
+    def __init__(self, precompute):
+        super().__init__()
+        self.precompute = precompute
+
+    def notify(self, args):
+        try:
+            self.precompute.fired(int(args.additionalInfo))
+        except:
+            self.precompute.ui.messageBox(precomputeFailedMsg.format(traceback.format_exc(3)))
+
+
+class Precompute:
+
+    def __init__(self, app, ui, command, cache):
+        self.app = app
+        self.ui = ui
+        self.command = command
+        self.cache = cache
+
+        self.generation = 0
+        self.steps = None
+
+        # An earlier dialog that wasn't closed cleanly can leave the
+        # event registered.
+        self.app.unregisterCustomEvent(PRECOMPUTE_EVENT_ID)
+        self.event = self.app.registerCustomEvent(PRECOMPUTE_EVENT_ID)
+        self.handler = PrecomputeEventHandler(self)
+        self.event.add(self.handler)
+
+    @property
+    def pending(self):
+        return self.steps is not None
+
+    def start(self, face, edge=None, dual=True):
+        """ Start the analysis of a newly selected face, and of the
+            secondary face, or the face opposite it when none is
+            selected.
+            """
+        self.cancel()
+        if face is None:
+            return
+
+        self.steps = self._analyse(face, edge, dual)
+        self._next()
+
+    def _analyse(self, face, edge, dual):
+        cache = self.cache
+        for step in (cache.dimensions, cache.orientation, cache.frame):
+            step(face)
+            yield
+
+        yield from cache.classify(face.body)
+
+        for vertex in face.vertices:
+            cache.perpendicular_edge(face, vertex)
+            yield
+
+        if dual:
+            other = edge if edge is not None else cache.opposite(face)
+            if other is not None:
+                cache.distance(self.app, face, other)
+
+    def cancel(self):
+        self.generation += 1
+        self.steps = None
+
+    def _next(self):
+        self.app.fireCustomEvent(PRECOMPUTE_EVENT_ID, str(self.generation))
+
+    def fired(self, generation):
+        if generation != self.generation or self.steps is None:
+            return
+
+        done = True
+        try:
+            next(self.steps)
+            done = False
+        except StopIteration:
+            pass
+        except RuntimeError:
+            # The selection was rolled back or deleted since it was made
+            pass
+        finally:
+            # A failed step ends the analysis, so the preview isn't held
+            if done:
+                self._finish()
+
+        if not done:
+            self._next()
+
+    def _finish(self):
+        self.steps = None
+        try:
+            self.command.doExecutePreview()
+        except RuntimeError:
+            # The dialog was closed while the analysis was running
+            pass
+
+    def stop(self):
+        self.cancel()
+        self.event.remove(self.handler)
+        self.app.unregisterCustomEvent(PRECOMPUTE_EVENT_ID)
@@ -0,0 +1,116 @@
+""" Coalesce bursts of input changes into a single preview.
+
+    Dragging a spinner changes its input many times a second, and Fusion
+    fires a preview for every change. While a change is pending, the
+    preview handler skips building anything; a timer thread restarts on
+    every change, and once the inputs have been idle for the interval it
+    fires a custom event. Fusion handles the custom event on the main
+    thread, where the preview is requested again. Requests from earlier
+    changes are dropped by comparing generations.
+    """
+import threading
+import traceback
+
+from adsk.core import CustomEventHandler
+
+from .. import definitions as defs
+
+PREVIEW_EVENT_ID = 'tabGenDebouncedPreview'
+
+# The inputs that are changed in quick succession
+DEBOUNCED_INPUTS = (
+    defs.tabWidthInputId,
+    defs.mtlThickInputId,
+    defs.lengthInputId,
+    defs.distanceInputId,
+    defs.marginInputId,
+    defs.edgeMarginInputId,
+    defs.kerfInputId,
+    defs.wallCountInputId,
+    defs.tabCountInputId
+)
+
+previewFailedMsg = 'TabGen preview failed: {}'
+
+
+class PreviewEventHandler(CustomEventHandler):
+
+    def __init__(self, scheduler):
+        super().__init__()
+        self.scheduler = scheduler
+
+    def notify(self, args):
+        try:
+            self.scheduler.fired(int(args.additionalInfo))
+        except:
+            self.scheduler.ui.messageBox(previewFailedMsg.format(traceback.format_exc(3)))
+
+
+class PreviewScheduler:
+
+    def __init__(self, app, ui, command, interval):
+        self.app = app
+        self.ui = ui
+        self.command = command
+        self.interval = interval
+
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.pending = False
+        self.timer = None
+
+        # An earlier dialog that wasn't closed cleanly can leave the
+        # event registered.
+        self.app.unregisterCustomEvent(PREVIEW_EVENT_ID)
+        self.event = self.app.registerCustomEvent(PREVIEW_EVENT_ID)
+        self.handler = PreviewEventHandler(self)
+        self.event.add(self.handler)
+
+    def debounces(self, id_):
+        return self.interval > 0 and id_ in DEBOUNCED_INPUTS
+
+    def schedule(self):
+        """ Restart the idle timer for another change.
+            """
+        with self.lock:
+            self.generation += 1
+            self.pending = True
+            if self.timer is not None:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.interval, self._elapsed, (self.generation,))
+            self.timer.daemon = True
+            self.timer.start()
+
+    def cancel(self):
+        """ Drop the pending preview; the next one is built right away.
+            """
+        with self.lock:
+            self.generation += 1
+            self.pending = False
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+    def _elapsed(self, generation):
+        # Runs on the timer thread, which can't use the rest of the API
+        with self.lock:
+            if generation != self.generation:
+                return
+        self.app.fireCustomEvent(PREVIEW_EVENT_ID, str(generation))
+
+    def fired(self, generation):
+        with self.lock:
+            if generation != self.generation or not self.pending:
+                return
+            self.pending = False
+            self.timer = None
+        try:
+            self.command.doExecutePreview()
+        except RuntimeError:
+            # The dialog was closed while the timer was running
+            pass
+
+    def stop(self):
+        self.cancel()
+        self.event.remove(self.handler)
+        self.app.unregisterCustomEvent(PREVIEW_EVENT_ID)
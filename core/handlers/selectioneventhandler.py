@@ -11,10 +11,11 @@ class SelectionValidationError(Exception): pass
 
 class SelectionEventHandler(SelectionEventHandler):
 
-    def __init__(self, app, ui):
+    def __init__(self, app, ui, cache):
         super().__init__()
         self.app = app
         self.ui = ui
+        self.cache = cache
 
     def valid_selection(self, selection):
         return selection.id in [defs.selectedFaceInputId, defs.dualEdgeSelectId]
@@ -26,10 +27,10 @@ class SelectionEventHandler(SelectionEventHandler):
         return inputs.face_parallel_to_edge(entity)
 
     def check_face_selection(self, entity, inputs):
-        if not (fusion.check_if_edge(entity)):
+        if entity.objectType == 'Sketch':
             return False
 
-        if entity.objectType == 'Sketch':
+        if not self.cache.is_edge(entity):
             return False
 
         return True
@@ -51,10 +52,17 @@ class SelectionEventHandler(SelectionEventHandler):
 
     def notify(self, args):
         try:
-            entity = args.selection.entity
             firingEvent = args.firingEvent
             selection = firingEvent.activeInput
-            inputs = fusion.InputReader(self.app, firingEvent.sender.commandInputs)
+
+            # Only the face inputs are checked, and this runs on every
+            # hover, so return before touching anything else.
+            if not self.valid_selection(selection):
+                args.isSelectable = True
+                return
+
+            entity = args.selection.entity
+            inputs = fusion.InputReader(self.app, firingEvent.sender.commandInputs, cache=self.cache)
 
             args.isSelectable = self.check_selection(entity, selection, inputs)
         except:
@@ -3,9 +3,13 @@ import traceback
 from adsk.core import ValidateInputsEventHandler
 
 from .. import fusion
+from .. import managers
+from ..layout import cost
 
 validateFailedMsg = 'TabGen validate inputs failed: {}'
 
+TOLERANCE = 1e-6
+
 
 class InputValidationError(Exception): pass
 
@@ -14,33 +18,64 @@ def check_edge(inputs):
     if not inputs.selected_face:
         return False
 
-    return fusion.check_if_edge(inputs.selected_face)
+    return inputs.cache.is_edge(inputs.selected_face)
+
+
+def check_secondary(inputs):
+    return inputs.single_edge_selected or inputs.edge_selected
+
+
+def check_layout(inputs, max_instances):
+    """ The face has to be long enough for at least one notch, and the
+        fingers can't be more than the command will create.
+        """
+    try:
+        layout = managers.plan_layout(inputs)
+    except (ArithmeticError, ValueError):
+        return False
+
+    if layout.adjusted_length <= 0 or layout.adjusted_finger_length <= 0:
+        return False
+
+    # The fingers have to fit on the face
+    if layout.finger_distance > layout.adjusted_length + TOLERANCE:
+        return False
+
+    # A face that starts with a notch is cut at the corners even
+    # without any patterned notches
+    corners = layout.offset and not inputs.tab_first
+    if layout.notches < 1 and not corners:
+        return False
+
+    return not cost.exceeds(managers.plan_estimate(inputs, layout), max_instances)
 
 
-def check_all(inputs):
-    if ((not inputs.face_selected) or
-       (inputs.dual_edge_selected and not inputs.edge_selected)):
+def check_all(inputs, max_instances=None):
+    if not inputs.face_selected or not check_secondary(inputs):
         return False
 
-    return check_edge(inputs)
+    return check_edge(inputs) and check_layout(inputs, max_instances)
 
 
 class ValidateInputsHandler(ValidateInputsEventHandler):
 
-    def __init__(self, app, ui):
+    def __init__(self, config, cache):
         super().__init__()
-        self.app = app
-        self.ui = ui
+        self.config = config
+        self.app = config.app
+        self.ui = config.ui
+        self.cache = cache
 
     def notify(self, args):
         try:
             # Validate that the tabs are being cut on the edge of
-            # material and that the face is long enough for at least
-            # one tab
+            # material, that the secondary face is selected, that the
+            # face is long enough for at least one tab, and that there
+            # aren't more fingers than execute would create
             first_inputs = args.inputs
             parent_inputs = args.inputs.command.commandInputs if args.inputs.command else first_inputs
-            inputs = fusion.InputReader(self.app, parent_inputs)
-            args.areInputsValid = check_all(inputs)
+            inputs = fusion.InputReader(self.app, parent_inputs, cache=self.cache)
+            args.areInputsValid = check_all(inputs, self.config.MAX_INSTANCES)
 
         except:
             raise InputValidationError(traceback.format_exc(3))
@@ -0,0 +1,41 @@
+from . import batch
+from . import corners
+from . import cost
+from . import evaluator
+from . import expressions
+from . import formulas
+from . import intervals
+from . import optimize
+from . import solver
+from . import units
+from .engine import Layout
+from .engine import auto_width
+from .engine import constant_count
+from .engine import constant_width
+from .engine import finger_count
+from .graph import Formula
+from .graph import FormulaGraph
+from .graph import Input
+from .intervals import Intervals
+
+__all__ = [
+    auto_width,
+    batch,
+    constant_count,
+    constant_width,
+    corners,
+    cost,
+    evaluator,
+    expressions,
+    finger_count,
+    Formula,
+    FormulaGraph,
+    formulas,
+    Input,
+    Intervals,
+    intervals,
+    Layout,
+    optimize,
+    solver,
+    units
+]
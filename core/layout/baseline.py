@@ -0,0 +1,153 @@
+""" The finger layouts as the strategy classes computed them before the
+    formulas were declared as a graph. They are kept unchanged, as a
+    fixed reference that the benchmark compares the graph against.
+
+    Each formula is the expression template that the strategy generated,
+    and the value that it computed in cm. Templates reference the other
+    values by key, the same way as the graph templates do.
+    """
+from collections import namedtuple
+from math import ceil, floor
+
+from .. import definitions as defs
+
+Reference = namedtuple('Reference', ['key', 'expression', 'value'])
+
+
+def _distance_two(distance, template, value):
+    if distance:
+        return Reference('distance_two', template, value)
+    return Reference('distance_two', '0', lambda v: 0)
+
+
+def _auto_width(tab_first, distance, counted=False):
+    references = [
+        Reference('adjusted_length', '(({face_length}) - ({margin})*2)',
+                  lambda v: v['face_length'] - v['margin']*2),
+        Reference('adjusted_depth', '(abs({depth}) - abs({kerf}/2))',
+                  lambda v: abs(v['depth']) - abs(v['kerf']/2))
+    ]
+    if not counted:
+        references.append(
+            Reference('fingers', '((ceil(max(3; floor({adjusted_length} / {default_width}))/2)*2)-1)',
+                      lambda v: (ceil(max(3, floor(v['adjusted_length'] / v['default_width']))/2)*2)-1))
+
+    references.extend([
+        Reference('finger_length', '({adjusted_length}/{fingers})',
+                  lambda v: v['adjusted_length']/v['fingers']),
+        Reference('adjusted_finger_length', '(abs({finger_length}) - abs({kerf}))',
+                  lambda v: abs(v['finger_length']) - abs(v['kerf'])),
+        Reference('finger_distance', '({finger_length} * {fingers}/1{units})',
+                  lambda v: v['finger_length']*v['fingers'])
+    ])
+
+    if tab_first:
+        references.extend([
+            Reference('notches', 'floor(({fingers}/1{units})/2)',
+                      lambda v: floor(v['fingers']/2)),
+            Reference('pattern_distance', '(({adjusted_length} - {finger_length}*3))',
+                      lambda v: v['adjusted_length'] - v['finger_length']*3)
+        ])
+    else:
+        references.extend([
+            Reference('notches', 'floor(({fingers}/1{units})/2) - 1',
+                      lambda v: floor(v['fingers']/2) - 1),
+            Reference('pattern_distance', '(({adjusted_length} - {finger_length}*5))',
+                      lambda v: v['adjusted_length'] - v['finger_length']*5)
+        ])
+
+    references.extend([
+        _distance_two(distance, '({distance} - {adjusted_depth} - abs({edge_margin})*2)',
+                      lambda v: v['distance'] - v['adjusted_depth'] - abs(v['edge_margin'])*2),
+        Reference('offset', '({margin} + {adjusted_finger_length}) + {kerf}/2',
+                  lambda v: (v['margin'] + v['adjusted_finger_length']) + v['kerf']/2)
+    ])
+
+    if tab_first:
+        references.append(Reference('start', '({offset} + {kerf})',
+                                    lambda v: v['offset'] + v['kerf']))
+    else:
+        references.append(Reference('start', '({offset} + {finger_length} + {kerf})',
+                                    lambda v: v['offset'] + v['finger_length'] + v['kerf']))
+
+    return references
+
+
+def _constant_width(tab_first, distance):
+    references = [
+        Reference('adjusted_length', '({face_length}) - ({margin})*2',
+                  lambda v: v['face_length'] - v['margin']*2),
+        Reference('adjusted_depth', '(abs({depth}) - abs({kerf})/2)',
+                  lambda v: abs(v['depth']) - abs(v['kerf'])/2),
+        Reference('fingers', '((ceil(max(3; floor({adjusted_length} / {default_width}))/2)*2)-1)',
+                  lambda v: (ceil(max(3, floor(v['adjusted_length'] / v['default_width']))/2)*2)-1),
+        Reference('finger_length', '({default_width} - {kerf})',
+                  lambda v: v['default_width'] - v['kerf']),
+        Reference('adjusted_finger_length', '(abs({finger_length}) - abs({kerf}))',
+                  lambda v: abs(v['finger_length']) - abs(v['kerf'])),
+        Reference('finger_distance', '({default_width} * {fingers}/1{units})',
+                  lambda v: v['default_width']*v['fingers'])
+    ]
+
+    if tab_first:
+        references.extend([
+            Reference('notches', 'floor(({fingers}/1{units})/2)',
+                      lambda v: floor(v['fingers']/2)),
+            Reference('pattern_distance', '(({finger_distance} - {default_width}*3))',
+                      lambda v: v['finger_distance'] - v['default_width']*3)
+        ])
+    else:
+        references.extend([
+            Reference('notches', 'ceil(({fingers}/1{units})/2)',
+                      lambda v: ceil(v['fingers']/2)),
+            Reference('pattern_distance', '({finger_distance} - {default_width})',
+                      lambda v: v['finger_distance'] - v['default_width'])
+        ])
+
+    references.append(_distance_two(distance, '({distance} - {adjusted_depth} - abs({edge_margin}*2))',
+                                    lambda v: v['distance'] - v['adjusted_depth'] - abs(v['edge_margin']*2)))
+
+    if tab_first:
+        references.extend([
+            Reference('offset', '({face_length} - {finger_distance})/2 - {kerf}/2',
+                      lambda v: (v['face_length'] - v['finger_distance'])/2 - v['kerf']/2),
+            Reference('start', '{offset} + {default_width} + {kerf}',
+                      lambda v: v['offset'] + v['default_width'] + v['kerf'])
+        ])
+    else:
+        references.extend([
+            Reference('offset', '({face_length} - {finger_distance})/2 + {kerf}/2',
+                      lambda v: (v['face_length'] - v['finger_distance'])/2 + v['kerf']/2),
+            Reference('start', '{offset}',
+                      lambda v: v['offset'])
+        ])
+
+    return references
+
+
+def _constant_count(tab_first, distance):
+    return _auto_width(tab_first, distance, counted=True)
+
+
+STRATEGIES = {
+    defs.automaticWidthId: _auto_width,
+    defs.userDefinedWidthId: _constant_width,
+    defs.constantCountId: _constant_count
+}
+
+
+def references(strategy, tab_first, distance):
+    """ The reference formulas of a strategy, in the order that the
+        strategy computed them.
+        """
+    return STRATEGIES[strategy](tab_first, distance)
+
+
+def evaluate(strategy, values):
+    """ The values that the strategy computed from the input values,
+        which include tab_first.
+        """
+    results = dict(values)
+    for reference in references(strategy, values['tab_first'], values['distance']):
+        results[reference.key] = reference.value(results)
+    return results
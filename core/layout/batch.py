@@ -0,0 +1,122 @@
+""" Solve many finger layouts at once, for sweeping designs over ranges
+    of face lengths, widths, kerfs, margins and tab placements.
+
+    With NumPy available, the formula graphs are evaluated on whole
+    arrays at once. Fusion 360 does not ship NumPy, so without it every
+    layout is evaluated in turn, and lists are returned instead.
+    """
+from itertools import product
+from itertools import repeat
+
+from .. import definitions as defs
+from . import formulas
+from .engine import Layout
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+GRAPHS = {
+    defs.automaticWidthId: formulas.AUTO_WIDTH,
+    defs.userDefinedWidthId: formulas.CONSTANT_WIDTH,
+    defs.constantCountId: formulas.CONSTANT_COUNT
+}
+
+
+class ArrayMath:
+    """ The math backend for evaluating arrays of layouts with NumPy.
+        """
+    if np is not None:
+        ceil = staticmethod(np.ceil)
+        floor = staticmethod(np.floor)
+        maximum = staticmethod(np.maximum)
+        abs = staticmethod(np.abs)
+        where = staticmethod(np.where)
+
+
+class UnknownFingerType(Exception): pass
+
+
+def _inputs(finger_type, face_length, depth, width, fingers, kerf,
+            margin, distance, edge_margin, tab_first):
+    if finger_type not in GRAPHS:
+        raise UnknownFingerType(finger_type)
+
+    values = {
+        'face_length': face_length,
+        'depth': depth,
+        'kerf': kerf,
+        'margin': margin,
+        'distance': distance,
+        'edge_margin': edge_margin,
+        'tab_first': tab_first
+    }
+    if finger_type == defs.constantCountId:
+        values['fingers'] = fingers
+    else:
+        values['default_width'] = width
+    return GRAPHS[finger_type], values
+
+
+def _solve_arrays(graph, values):
+    keys = list(values)
+    arrays = np.broadcast_arrays(*[np.asarray(values[key], dtype=bool if key == 'tab_first' else float)
+                                   for key in keys])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        results = graph.evaluate(dict(zip(keys, arrays)), m=ArrayMath)
+    return Layout(*[np.broadcast_to(results[field], arrays[0].shape) for field in Layout._fields])
+
+
+def _solve_lists(graph, values):
+    sizes = {len(value) for value in values.values() if isinstance(value, (list, tuple))}
+    if len(sizes) > 1:
+        raise ValueError('inputs have different lengths: {}'.format(sorted(sizes)))
+    size = sizes.pop() if sizes else 1
+
+    columns = {key: value if isinstance(value, (list, tuple)) else repeat(value, size)
+               for key, value in values.items()}
+    rows = [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+    solved = {field: [] for field in Layout._fields}
+    for row in rows:
+        try:
+            results = graph.evaluate(row)
+        except ZeroDivisionError:
+            results = {field: float('nan') for field in Layout._fields}
+        for field in Layout._fields:
+            solved[field].append(results[field])
+    return Layout(*[solved[field] for field in Layout._fields])
+
+
+def solve(finger_type, face_length, depth, width=None, fingers=None, kerf=0,
+          margin=0, distance=0, edge_margin=0, tab_first=True, use_numpy=True):
+    """ Solve a layout for each set of inputs. Each input can be a
+        single value or an array; arrays are broadcast together, and
+        grid() builds the arrays for every combination of ranges.
+        finger_type is one of the finger type ids in core.definitions;
+        width is used for the width types, and fingers for Constant Count.
+
+        Returns a Layout of arrays, or of lists when NumPy is not
+        available. Layouts that can't be solved, such as a zero width,
+        are NaN or infinite.
+        """
+    graph, values = _inputs(finger_type, face_length, depth, width, fingers,
+                            kerf, margin, distance, edge_margin, tab_first)
+
+    if np is not None and use_numpy:
+        return _solve_arrays(graph, values)
+    return _solve_lists(graph, values)
+
+
+def grid(**ranges):
+    """ Every combination of the given input ranges, as flat arrays that
+        can be passed to solve().
+        """
+    keys = list(ranges)
+    if np is not None:
+        mesh = np.meshgrid(*[np.asarray(ranges[key]) for key in keys], indexing='ij')
+        return {key: values.ravel() for key, values in zip(keys, mesh)}
+
+    rows = list(product(*[list(ranges[key]) for key in keys]))
+    return {key: [row[index] for row in rows] for index, key in enumerate(keys)}
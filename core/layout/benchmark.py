@@ -0,0 +1,257 @@
+""" Equivalence checks and throughput benchmarks for the finger layout
+    math. This only needs the pure-Python layout package, so it runs
+    headless, outside of Fusion 360:
+
+        python -m core.layout.benchmark --count 20000
+
+    Every generated layout is solved numerically and compared against
+    the values that the original strategy classes computed. The
+    expression strings for the same layout, as generated and after they
+    are optimized, and the original strategies' expressions are
+    evaluated locally in each of the --units and compared against the
+    numeric values. The exit status is non-zero if any layout
+    disagrees, or if a throughput falls below --min-rate.
+    """
+import argparse
+import math
+import random
+import sys
+import time
+
+from collections import namedtuple
+
+from .. import definitions as defs
+from . import baseline
+from . import batch
+from . import evaluator
+from . import formulas
+from . import optimize
+from .units import LENGTH_UNITS
+from .units import from_internal
+
+STRATEGIES = (defs.automaticWidthId, defs.userDefinedWidthId, defs.constantCountId)
+
+Case = namedtuple('Case', ['face_length', 'width', 'fingers', 'depth', 'kerf',
+                           'margin', 'distance', 'edge_margin', 'tab_first'])
+
+Mismatch = namedtuple('Mismatch', ['strategy', 'case', 'units', 'key', 'numeric', 'expression'])
+
+UNITS = ('cm', 'mm', 'in')
+
+# Values that are plain numbers in every unit
+COUNTS = ('fingers', 'interior', 'notches', 'tab_first')
+
+
+def edge_cases():
+    """ Inputs at the edges of what the dialog allows, and past them.
+        """
+    for tab_first in (True, False):
+        # Tiny widths
+        yield Case(250.0, 0.01, 2, 0.32, 0, 0, 0, 0, tab_first)
+        yield Case(0.5, 0.2, 2, 0.05, 0, 0, 0, 0, tab_first)
+        # Margins that consume all, or more than all, of the face
+        yield Case(10.0, 0.8, 3, 0.32, 0, 5.0, 5.0, 0, tab_first)
+        yield Case(10.0, 0.8, 3, 0.32, 0, 6.0, 5.0, 0.1, tab_first)
+        # Kerf larger than the depth, and larger than the fingers
+        yield Case(30.0, 0.8, 7, 0.32, 0.5, 0, 10.0, 0, tab_first)
+        yield Case(30.0, 0.2, 7, 0.32, 1.0, 0, 10.0, 0, tab_first)
+        # Widths longer than the face
+        yield Case(2.0, 5.0, 2, 0.32, 0, 0, 0, 0, tab_first)
+        # Very long faces
+        yield Case(250.0, 0.2, 200, 10.2, 0.05, 0.1, 250.0, 0.1, tab_first)
+
+
+def random_cases(count, rng):
+    for _ in range(count):
+        yield Case(face_length=rng.uniform(0.5, 250.0),
+                   width=rng.choice([rng.uniform(0.01, 1.0), rng.uniform(0.2, 250.0)]),
+                   fingers=rng.randint(2, 200),
+                   depth=rng.uniform(0.05, 10.2),
+                   kerf=rng.choice([0, rng.uniform(0, 0.1), rng.uniform(0, 5.08)]),
+                   margin=rng.choice([0, rng.uniform(0, 2.0), rng.uniform(0, 250.0)]),
+                   distance=rng.choice([0, rng.uniform(0.1, 250.0)]),
+                   edge_margin=rng.choice([0, rng.uniform(0, 2.0)]),
+                   tab_first=rng.random() < 0.5)
+
+
+def _values(strategy, case):
+    graph, values = batch._inputs(strategy, case.face_length, case.depth, case.width,
+                                  case.fingers, case.kerf, case.margin, case.distance,
+                                  case.edge_margin, case.tab_first)
+    values['interior'] = 0
+    return graph, values
+
+
+def _in_units(key, value, units):
+    return value if key in COUNTS else from_internal(value, units)
+
+
+def _expressions(graph, case, values, units='cm'):
+    """ The named expressions for a layout, and the named input values
+        that they reference, in the given units.
+        """
+    name = graph.name
+    expressions = {name(key): expression
+                   for key, expression in graph.expressions(name, units, case.tab_first, values).items()}
+    seeds = {name(key): _in_units(key, value, units) for key, value in values.items()}
+    return expressions, seeds
+
+
+def _baseline_expressions(strategy, graph, case, units):
+    """ The expressions that the original strategy generated for a
+        layout, named the same way as the graph's expressions.
+        """
+    fields = {key: graph.name(key) for key in graph.input_keys + tuple(graph.by_key)}
+    return {graph.name(reference.key): reference.expression.format(units=units, **fields)
+            for reference in baseline.references(strategy, case.tab_first, case.distance)}
+
+
+def _numeric(func, *args):
+    try:
+        return func(*args)
+    except ZeroDivisionError:
+        return None
+
+
+def _close(first, second):
+    return math.isclose(first, second, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def check(strategy, case, units='cm'):
+    """ Compare the numeric layout with the values of the original
+        strategy, and with its evaluated expressions in the given units.
+        Returns a list of the values that disagree.
+        """
+    graph, values = _values(strategy, case)
+    numeric = _numeric(graph.evaluate, values)
+    reference = _numeric(baseline.evaluate, strategy, values)
+
+    mismatches = []
+    if (numeric is None) != (reference is None):
+        mismatches.append(Mismatch(strategy, case, 'cm', 'baseline solvable',
+                                   numeric is not None, reference is not None))
+    elif numeric is not None:
+        for key in graph.by_key:
+            if not _close(numeric[key], reference[key]):
+                mismatches.append(Mismatch(strategy, case, 'cm', 'baseline ' + key,
+                                           numeric[key], reference[key]))
+
+    # Counts are divided by 1{units} in the expressions, so that they
+    # are plain numbers in every unit
+    name = graph.name
+    expressions, seeds = _expressions(graph, case, values, units)
+
+    keep = {name(key) for key in graph.kept(formulas.BOUND)}
+    optimized, _ = optimize.optimize(expressions, keep)
+
+    for label, expression_set in (('', expressions), ('optimized ', optimized),
+                                  ('baseline expression ', _baseline_expressions(strategy, graph, case, units))):
+        try:
+            evaluated = evaluator.evaluate_all(expression_set, seeds, units)
+        except evaluator.ParameterSetError:
+            evaluated = None
+
+        if numeric is None or evaluated is None:
+            if (numeric is None) != (evaluated is None):
+                mismatches.append(Mismatch(strategy, case, units, label + 'solvable',
+                                           numeric is not None, evaluated is not None))
+            continue
+
+        for key in graph.by_key:
+            if name(key) not in evaluated:
+                continue
+            expected = _in_units(key, numeric[key], units)
+            if not _close(expected, evaluated[name(key)]):
+                mismatches.append(Mismatch(strategy, case, units, label + key,
+                                           expected, evaluated[name(key)]))
+    return mismatches
+
+
+def _rate(count, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    return count / elapsed if elapsed else float('inf')
+
+
+def throughput(strategy, cases):
+    """ Layouts per second for the scalar engine, the batch solver and
+        the evaluated expressions.
+        """
+    graph = batch.GRAPHS[strategy]
+    values = [_values(strategy, case)[1] for case in cases]
+    rates = {}
+
+    def scalar():
+        for value in values:
+            _numeric(graph.evaluate, value)
+    rates['engine'] = _rate(len(values), scalar)
+
+    columns = {field: [getattr(case, field) for case in cases] for field in Case._fields}
+    if batch.np is not None:
+        columns = {field: batch.np.asarray(column) for field, column in columns.items()}
+
+    def solve():
+        batch.solve(strategy, columns['face_length'], columns['depth'],
+                    width=columns['width'], fingers=columns['fingers'],
+                    kerf=columns['kerf'], margin=columns['margin'],
+                    distance=columns['distance'], edge_margin=columns['edge_margin'],
+                    tab_first=columns['tab_first'])
+    rates['batch'] = _rate(len(cases), solve)
+
+    # Evaluating the expressions is much slower, so only a sample is timed
+    sample = cases[:max(1, len(cases)//10)]
+    expressions = [_expressions(graph, case, _values(strategy, case)[1]) for case in sample]
+
+    def evaluate():
+        for expression_set, seeds in expressions:
+            try:
+                evaluator.evaluate_all(expression_set, seeds, 'cm')
+            except evaluator.ParameterSetError:
+                pass
+    rates['expressions'] = _rate(len(sample), evaluate)
+
+    return rates
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--count', type=int, default=10000, help='random layouts per strategy')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--min-rate', type=float, default=0,
+                        help='fail if the engine solves fewer layouts per second')
+    parser.add_argument('--show', type=int, default=10, help='mismatches to print')
+    parser.add_argument('--units', nargs='+', default=UNITS, choices=sorted(LENGTH_UNITS),
+                        help='units to evaluate the expressions in')
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    cases = list(edge_cases()) + list(random_cases(args.count, rng))
+
+    failed = False
+    print('{:<16} {:>10} {:>14} {:>14} {:>14}'.format('strategy', 'mismatches', 'engine/s',
+                                                      'batch/s', 'expressions/s'))
+    for strategy in STRATEGIES:
+        mismatches = [mismatch for units in args.units for case in cases
+                      for mismatch in check(strategy, case, units)]
+        rates = throughput(strategy, cases)
+
+        print('{:<16} {:>10} {:>14,.0f} {:>14,.0f} {:>14,.0f}'.format(strategy, len(mismatches),
+                                                                      rates['engine'], rates['batch'],
+                                                                      rates['expressions']))
+        for mismatch in mismatches[:args.show]:
+            print('    {} ({}): numeric={} expression={}\n        {}'.format(mismatch.key, mismatch.units,
+                                                                            mismatch.numeric, mismatch.expression,
+                                                                            mismatch.case))
+
+        if mismatches or rates['engine'] < args.min_rate:
+            failed = True
+
+    if batch.np is None:
+        print('NumPy is not installed; the batch solver was timed without it.')
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+""" Find the corners where two finger joints on the same body would
+    cut the same material.
+
+    Each joint is recorded with the world position of the start of its
+    face, the direction along the face, and its planned cuts. When two
+    joints meet at a corner of a panel, each one cuts into the corner
+    to the depth of the other; if both of them have a cut in that
+    corner square, the second set of features removes material that is
+    already gone, and Fusion leaves it in an unhealthy state.
+    """
+import json
+import math
+
+from collections import namedtuple
+
+from .intervals import Intervals
+
+# origin: world point (cm) of the start of the cuts along the face
+# direction: unit vector along the face
+# width: width of the face, which is the thickness of the panel
+# depth: kerf adjusted depth of the cuts
+# cuts: the Intervals along the face
+# feature: name of the finger cut feature, once the joint is built
+Joint = namedtuple('Joint', ['name', 'origin', 'direction', 'width', 'depth', 'cuts', 'feature'],
+                   defaults=(None,))
+
+# end: 0 for the start of a face and 1 for the end of it
+Conflict = namedtuple('Conflict', ['joint', 'other', 'end', 'other_end'])
+
+TOLERANCE = 1e-4
+
+
+def as_dict(joint):
+    data = joint._asdict()
+    data['origin'] = list(joint.origin)
+    data['direction'] = list(joint.direction)
+    data['cuts'] = joint.cuts.as_dict()
+    return data
+
+
+def from_dict(data):
+    data = dict(data)
+    data['cuts'] = Intervals.from_dict(data['cuts'])
+    data['origin'] = tuple(data['origin'])
+    data['direction'] = tuple(data['direction'])
+    return Joint(**data)
+
+
+def to_json(joint):
+    return json.dumps(as_dict(joint))
+
+
+def from_json(text):
+    return from_dict(json.loads(text))
+
+
+def copy_offsets(edge_margin, distance_two, interior):
+    """ How far into the body each copy of the cuts starts. Every cut is
+        extruded from edge_margin below the face; with a secondary face
+        the pattern spreads interior + 2 copies across distance_two.
+        """
+    start = abs(edge_margin)
+    distance_two = abs(distance_two)
+    if not distance_two:
+        return [start]
+    copies = interior + 2
+    return [start + distance_two*copy/(copies - 1) for copy in range(copies)]
+
+
+def _end(joint, end):
+    distance = joint.cuts.length*end
+    return tuple(point + axis*distance for point, axis in zip(joint.origin, joint.direction))
+
+
+def _distance(first, second):
+    return math.sqrt(sum((a - b)**2 for a, b in zip(first, second)))
+
+
+def _corner(joint, end, depth):
+    """ The interval along the face that is inside the corner square.
+        """
+    if end:
+        return joint.cuts.length - depth, joint.cuts.length
+    return 0, depth
+
+
+def conflicts(joint, others):
+    """ The corners where the joint and one of the other joints on
+        the same body both have a cut.
+        """
+    found = []
+    for other in others:
+        # Joints along parallel faces never share a corner
+        if abs(sum(a*b for a, b in zip(joint.direction, other.direction))) > 1 - TOLERANCE:
+            continue
+
+        # The faces meet at a corner if their ends are no further apart
+        # than the thickness of the panel.
+        reach = max(joint.width, other.width) + TOLERANCE
+        for end in (0, 1):
+            for other_end in (0, 1):
+                if _distance(_end(joint, end), _end(other, other_end)) > reach:
+                    continue
+                if (joint.cuts.intersects(*_corner(joint, end, other.depth)) and
+                        other.cuts.intersects(*_corner(other, other_end, joint.depth))):
+                    found.append(Conflict(joint, other, end, other_end))
+    return found
@@ -0,0 +1,93 @@
+""" Estimate how much work Fusion will do to build a finger layout,
+    before anything is created.
+
+    The counts follow what FingerManager draws: a construction line,
+    constraints and an offset dimension for every model parameter, one
+    finger rectangle that is cut and patterned across the face, and,
+    when the face starts with a notch, two corner rectangles that are
+    cut and patterned to the secondary face. Recomputing the pattern
+    instances is what takes Fusion the longest.
+    """
+from collections import namedtuple
+
+Cost = namedtuple('Cost', ['pattern_instances', 'sketch_entities', 'constraints', 'parameters'])
+
+# The face edges that are added, and then projected, into the sketch
+BORDER_LINES = 8
+
+# Construction line: 2 coincident, parallel and offset dimension
+PARAMETER_CONSTRAINTS = 4
+
+# Rectangle: 4 horizontal/vertical, 2 coincident and 2 dimensions
+FINGER_CONSTRAINTS = 8
+CORNER_CONSTRAINTS = 7
+
+
+def estimate(layout, tab_first, parameters, interior=0):
+    """ The cost of building a Layout. parameters is the number of model
+        parameters the strategy creates, and interior the number of
+        interior walls.
+        """
+    notches = max(0, int(layout.notches))
+    corners = bool(layout.offset) and not tab_first
+    secondary = interior + 2 if layout.distance_two else 1
+
+    pattern_instances = notches*secondary
+    sketch_entities = BORDER_LINES + parameters + 4
+    constraints = parameters*PARAMETER_CONSTRAINTS + FINGER_CONSTRAINTS
+    # The finger and start dimensions also create model parameters
+    dimensions = 2
+
+    if corners:
+        pattern_instances += 2
+        sketch_entities += 8
+        constraints += CORNER_CONSTRAINTS*2
+        dimensions += 2
+
+    return Cost(pattern_instances, sketch_entities, constraints, parameters + dimensions)
+
+
+def exceeds(cost, instances=None):
+    """ Describe the limit that the cost is over, if any; a limit of
+        None is not checked.
+
+        Only the pattern instances are limited. The number of API calls
+        doesn't grow with the layout, since each pattern is one feature
+        however many instances it has.
+        """
+    reasons = []
+    if instances is not None and cost.pattern_instances > instances:
+        reasons.append('{} pattern instances (limit {})'.format(cost.pattern_instances, instances))
+    return reasons
+
+
+# Preview fidelity levels
+PRIMARY_ONLY = 1
+TRUNCATED = 2
+FULL = 3
+
+# level: one of the levels above
+# notches: the number of notches to pattern
+# secondary: whether the cuts are patterned to the secondary face
+Fidelity = namedtuple('Fidelity', ['level', 'notches', 'secondary'])
+
+
+def fidelity(layout, tab_first, parameters, interior=0, instances=None):
+    """ The most detailed preview that stays within the instance limit.
+        Returns None when not even the primary face can be previewed.
+        """
+    full = estimate(layout, tab_first, parameters, interior)
+    notches = max(0, int(layout.notches))
+
+    if not exceeds(full, instances):
+        return Fidelity(FULL, notches, True)
+
+    corners = 2 if layout.offset and not tab_first else 0
+    copies = interior + 2 if layout.distance_two else 1
+    available = instances - corners
+
+    if available//copies >= 1:
+        return Fidelity(TRUNCATED, min(notches, available//copies), True)
+    if available >= 1:
+        return Fidelity(PRIMARY_ONLY, min(notches, available), False)
+    return None
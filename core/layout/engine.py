@@ -0,0 +1,66 @@
+from collections import namedtuple
+
+from . import formulas
+from .graph import ScalarMath
+
+# All lengths are in Fusion's internal units (cm); fingers and notches
+# are plain counts.
+Layout = namedtuple('Layout', ['adjusted_length', 'adjusted_depth', 'fingers',
+                               'finger_length', 'adjusted_finger_length',
+                               'finger_distance', 'notches', 'pattern_distance',
+                               'distance_two', 'offset', 'start'])
+
+
+def layout(graph, values):
+    """ Evaluate a formula graph into a Layout.
+        """
+    results = graph.evaluate(values)
+    return Layout(*[results[field] for field in Layout._fields])
+
+
+def finger_count(adjusted_length, width):
+    """ The odd number of fingers, with a minimum of three, that
+        best fits the target width across the adjusted length.
+        """
+    return formulas.AUTO_WIDTH.by_key['fingers'].value(ScalarMath, {
+        'adjusted_length': adjusted_length,
+        'default_width': width
+    })
+
+
+def auto_width(face_length, width, depth, kerf=0, margin=0,
+               distance=0, edge_margin=0, tab_first=True):
+    """ Size the fingers up or down so that all of the fingers,
+        including the ones at the edges of the face, are the
+        same length.
+        """
+    return layout(formulas.AUTO_WIDTH, {
+        'face_length': face_length, 'default_width': width, 'depth': depth,
+        'kerf': kerf, 'margin': margin, 'distance': distance,
+        'edge_margin': edge_margin, 'tab_first': tab_first
+    })
+
+
+def constant_width(face_length, width, depth, kerf=0, margin=0,
+                   distance=0, edge_margin=0, tab_first=True):
+    """ Keep every finger at the requested width, and center the
+        fingers on the face by offsetting the first and last finger
+        from the edges.
+        """
+    return layout(formulas.CONSTANT_WIDTH, {
+        'face_length': face_length, 'default_width': width, 'depth': depth,
+        'kerf': kerf, 'margin': margin, 'distance': distance,
+        'edge_margin': edge_margin, 'tab_first': tab_first
+    })
+
+
+def constant_count(face_length, fingers, depth, kerf=0, margin=0,
+                   distance=0, edge_margin=0, tab_first=True):
+    """ Use the requested number of fingers, and size them to fill
+        the face.
+        """
+    return layout(formulas.CONSTANT_COUNT, {
+        'face_length': face_length, 'fingers': fingers, 'depth': depth,
+        'kerf': kerf, 'margin': margin, 'distance': distance,
+        'edge_margin': edge_margin, 'tab_first': tab_first
+    })
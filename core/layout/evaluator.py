@@ -0,0 +1,373 @@
+""" A parser and evaluator for the subset of the Fusion 360 expression
+    dialect that TabGen generates. Expressions can be checked and
+    evaluated locally, before any of them are handed to Fusion.
+
+    Values are evaluated in a single length unit, the same way that
+    Fusion treats a unitless number in a length expression as the
+    default length unit of the design.
+    """
+import math
+import re
+
+from collections import ChainMap
+from collections import namedtuple
+from functools import lru_cache
+
+from . import units as length_units
+from .units import LENGTH_UNITS
+
+FUNCTIONS = {
+    'abs': (abs, 1),
+    'ceil': (math.ceil, 1),
+    'floor': (math.floor, 1),
+    'max': (max, None),
+    'min': (min, None),
+    'round': (round, 1),
+    'sqrt': (math.sqrt, 1)
+}
+
+Number = namedtuple('Number', ['value', 'unit'])
+Name = namedtuple('Name', ['id'])
+Unary = namedtuple('Unary', ['op', 'operand'])
+Binary = namedtuple('Binary', ['op', 'left', 'right'])
+Call = namedtuple('Call', ['func', 'args'])
+
+Token = namedtuple('Token', ['kind', 'text', 'position'])
+
+TOKENS = re.compile(r'\s*(?:(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)|'
+                    r'(?P<name>[A-Za-z_][A-Za-z0-9_]*)|'
+                    r'(?P<op>[-+*/^();]))')
+
+
+class ExpressionError(Exception): pass
+
+
+class ParameterSetError(ExpressionError):
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__('\n'.join('{}: {}'.format(name, error)
+                                   for name, error in sorted(errors.items())))
+
+
+def tokenize(expression):
+    tokens = []
+    position = 0
+    end = len(expression.rstrip())
+
+    while position < end:
+        match = TOKENS.match(expression, position)
+        if not match:
+            raise ExpressionError('unexpected character {!r} at {} in {!r}'.format(
+                expression[position:].lstrip()[:1], position, expression))
+        kind = match.lastgroup
+        tokens.append(Token(kind, match.group(kind), match.start(kind)))
+        position = match.end()
+
+    return tokens
+
+
+def _constant(node):
+    """ Whether the node is made of plain numbers only.
+        """
+    if isinstance(node, Number):
+        return not node.unit
+    if isinstance(node, Unary):
+        return _constant(node.operand)
+    if isinstance(node, Binary):
+        return _constant(node.left) and _constant(node.right)
+    if isinstance(node, Call):
+        return all(_constant(arg) for arg in node.args)
+    return False
+
+
+class Parser:
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = tokenize(expression)
+        self.index = 0
+
+    def error(self, message):
+        return ExpressionError('{} in {!r}'.format(message, self.expression))
+
+    def peek(self):
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def take(self, text=None):
+        token = self.peek()
+        if token is None:
+            raise self.error('unexpected end of expression')
+        if text is not None and token.text != text:
+            raise self.error('expected {!r} at {}'.format(text, token.position))
+        self.index += 1
+        return token
+
+    def accept(self, *texts):
+        token = self.peek()
+        if token is not None and token.kind == 'op' and token.text in texts:
+            self.index += 1
+            return token
+
+    def parse(self):
+        if not self.tokens:
+            raise self.error('empty expression')
+        node = self.sum()
+        token = self.peek()
+        if token is not None:
+            raise self.error('unexpected {!r} at {}'.format(token.text, token.position))
+        return node
+
+    def sum(self):
+        node = self.product()
+        while True:
+            token = self.accept('+', '-')
+            if not token:
+                return node
+            node = Binary(token.text, node, self.product())
+
+    def product(self):
+        node = self.unary()
+        while True:
+            unit = self.unit()
+            if unit:
+                node = self.with_unit(node, unit)
+                continue
+            token = self.accept('*', '/')
+            if not token:
+                return node
+            node = Binary(token.text, node, self.unary())
+
+    def unit(self):
+        token = self.peek()
+        if token is None or token.kind != 'name':
+            return None
+        if token.text not in LENGTH_UNITS:
+            raise self.error('unknown unit {!r} at {}'.format(token.text, token.position))
+        self.index += 1
+        return token
+
+    def unary(self):
+        token = self.accept('+', '-')
+        if token:
+            return Unary(token.text, self.unary())
+        return self.power()
+
+    def power(self):
+        node = self.atom()
+        if self.accept('^'):
+            return Binary('^', node, self.unary())
+        return node
+
+    def atom(self):
+        token = self.take()
+
+        if token.kind == 'number':
+            return Number(float(token.text), None)
+
+        if token.kind == 'name':
+            if self.accept('('):
+                return self.call(token)
+            return Name(token.text)
+
+        if token.text == '(':
+            node = self.sum()
+            self.take(')')
+            return node
+
+        raise self.error('unexpected {!r} at {}'.format(token.text, token.position))
+
+    def with_unit(self, node, unit):
+        """ A unit applies to the number before it. A term of plain
+            numbers, such as a fraction, is one value, the same way as
+            in Fusion: 1/8 in is an eighth of an inch, not 1/(8 in),
+            while x/1mm still divides x by 1mm.
+            """
+        if isinstance(node, Number) and node.unit:
+            raise self.error('unexpected unit {!r} at {}'.format(unit.text, unit.position))
+        if isinstance(node, Number):
+            return Number(node.value, unit.text)
+        if not _constant(node) and isinstance(node, Binary) and isinstance(node.right, Number):
+            return Binary(node.op, node.left, self.with_unit(node.right, unit))
+        return Binary('*', node, Number(1.0, unit.text))
+
+    def call(self, token):
+        if token.text not in FUNCTIONS:
+            raise self.error('unknown function {!r} at {}'.format(token.text, token.position))
+
+        args = [self.sum()]
+        while self.accept(';'):
+            args.append(self.sum())
+        self.take(')')
+
+        arity = FUNCTIONS[token.text][1]
+        if (arity is not None and len(args) != arity) or (arity is None and len(args) < 2):
+            raise self.error('wrong number of arguments to {}()'.format(token.text))
+
+        return Call(token.text, tuple(args))
+
+
+@lru_cache(maxsize=1024)
+def parse(expression):
+    """ Parse an expression into a tree of Number, Name, Unary,
+        Binary and Call nodes.
+        """
+    return Parser(expression).parse()
+
+
+def references(expression):
+    """ The set of parameter names used by an expression.
+        """
+    names = set()
+    nodes = [parse(expression)]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, Name):
+            names.add(node.id)
+        elif isinstance(node, Unary):
+            nodes.append(node.operand)
+        elif isinstance(node, Binary):
+            nodes.extend((node.left, node.right))
+        elif isinstance(node, Call):
+            nodes.extend(node.args)
+    return names
+
+
+def _divide(left, right):
+    if right == 0:
+        raise ExpressionError('division by zero')
+    return left / right
+
+
+OPERATORS = {
+    '+': lambda left, right: left + right,
+    '-': lambda left, right: left - right,
+    '*': lambda left, right: left * right,
+    '/': _divide,
+    '^': lambda left, right: left ** right
+}
+
+
+def _compile(node, units):
+    if isinstance(node, Number):
+        value = node.value
+        if node.unit:
+            value = length_units.convert(value, node.unit, units)
+        return lambda values: value
+
+    if isinstance(node, Name):
+        name = node.id
+
+        def lookup(values):
+            try:
+                return values[name]
+            except KeyError:
+                raise ExpressionError('unknown parameter {!r}'.format(name))
+        return lookup
+
+    if isinstance(node, Unary):
+        operand = _compile(node.operand, units)
+        if node.op == '-':
+            return lambda values: -operand(values)
+        return operand
+
+    if isinstance(node, Binary):
+        operator = OPERATORS[node.op]
+        left = _compile(node.left, units)
+        right = _compile(node.right, units)
+        return lambda values: operator(left(values), right(values))
+
+    func = FUNCTIONS[node.func][0]
+    args = [_compile(arg, units) for arg in node.args]
+    if len(args) == 1:
+        arg = args[0]
+        return lambda values: func(arg(values))
+    return lambda values: func(*[arg(values) for arg in args])
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(expression, units='cm'):
+    """ Compile an expression into a function that takes a mapping
+        of parameter names to values, and returns the value of the
+        expression in the given length units.
+        """
+    if units not in LENGTH_UNITS:
+        raise ExpressionError('unknown unit {!r}'.format(units))
+    return _compile(parse(expression), units)
+
+
+def evaluate(expression, values=None, units='cm'):
+    return compile_expression(expression, units)(values or {})
+
+
+def dependency_order(expressions):
+    """ Order the names of a set of expressions so that every expression
+        comes after the expressions that it references.
+        """
+    ordered = []
+    state = {}
+
+    def visit(name, path):
+        if state.get(name) == 'done':
+            return
+        if state.get(name) == 'visiting':
+            raise ExpressionError('circular reference: {}'.format(' -> '.join(path + [name])))
+        state[name] = 'visiting'
+        for reference in sorted(references(expressions[name])):
+            if reference in expressions and reference != name:
+                visit(reference, path + [name])
+            elif reference == name:
+                raise ExpressionError('{} references itself'.format(name))
+        state[name] = 'done'
+        ordered.append(name)
+
+    for name in expressions:
+        visit(name, [])
+
+    return ordered
+
+
+def evaluate_all(expressions, values=None, units='cm'):
+    """ Validate and evaluate a whole set of named expressions. Names
+        that are not defined in the set are resolved from values.
+
+        Every expression is checked, and a ParameterSetError listing all
+        of the failures is raised if any of them are invalid.
+        """
+    results = {}
+    lookup = ChainMap(results, values) if values is not None else results
+    errors = {}
+
+    compiled = {}
+    for name, expression in expressions.items():
+        try:
+            compiled[name] = compile_expression(expression, units)
+        except ExpressionError as err:
+            errors[name] = str(err)
+
+    try:
+        order = dependency_order({name: expressions[name] for name in compiled})
+    except ExpressionError as err:
+        errors['<parameters>'] = str(err)
+        order = []
+
+    for name in order:
+        try:
+            value = compiled[name](lookup)
+        except ExpressionError as err:
+            errors[name] = str(err)
+            continue
+        except (ArithmeticError, TypeError, ValueError) as err:
+            errors[name] = '{}: {}'.format(type(err).__name__, err)
+            continue
+
+        if not math.isfinite(value):
+            errors[name] = 'value is not finite'
+            continue
+
+        results[name] = value
+
+    if errors:
+        raise ParameterSetError(errors)
+
+    return {name: results[name] for name in expressions}
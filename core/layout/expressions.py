@@ -0,0 +1,21 @@
+""" Fusion expression strings for each finger layout. These are only
+    needed when the parametric features are enabled, so they are
+    produced separately from the numeric layout in engine.py.
+
+    Each function takes a callable that maps a parameter name suffix,
+    such as 'face_length' or 'fingers', to the full name of its model
+    parameter. The results are keyed by the Layout field names.
+    """
+from . import formulas
+
+
+def auto_width(name, units, tab_first, distance):
+    return formulas.AUTO_WIDTH.expressions(name, units, tab_first, {'distance': distance})
+
+
+def constant_width(name, units, tab_first, distance):
+    return formulas.CONSTANT_WIDTH.expressions(name, units, tab_first, {'distance': distance})
+
+
+def constant_count(name, units, tab_first, distance):
+    return formulas.CONSTANT_COUNT.expressions(name, units, tab_first, {'distance': distance})
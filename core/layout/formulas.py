@@ -0,0 +1,141 @@
+""" The formula graphs for each type of finger layout. The automatic
+    width layout declares every formula; the constant width and constant
+    count layouts are overlays that only declare what is different.
+
+    Lengths are in Fusion's internal units (cm); fingers and notches are
+    plain counts. The expression templates reference other values by
+    key, and {units} is the default length unit of the design.
+    """
+from .graph import branch
+from .graph import Formula
+from .graph import FormulaGraph
+from .graph import Input
+
+INPUTS = (
+    Input('default_width', 'width', 'default_width', 'default finger width'),
+    Input('margin', 'margin', 'margin', 'margin from the sides of the face to offset notches'),
+    Input('face_length', 'length', 'face_length', 'length of the face to place fingers'),
+    Input('edge_margin', 'edge_margin', 'edge_margin', 'offset from face to cut notches'),
+    Input('depth', 'depth', 'depth', 'depth of the notches to cut'),
+    Input('kerf', 'kerf', 'kerf', 'kerf applied to offset cuts'),
+    Input('distance', 'distance', 'distance', 'distance to secondary face'),
+    Input('interior', 'interior', 'interior_walls', 'number of interior walls', parameter=False)
+)
+
+COUNT_INPUTS = (
+    Input('fingers', 'finger_count', 'fingers', 'total number of fingers across the jointed faces'),
+) + INPUTS[1:]
+
+# The values that sketch dimensions and features refer to by name; the
+# strategies always create these as model parameters.
+BOUND = ('adjusted_depth', 'adjusted_finger_length', 'pattern_distance',
+         'distance_two', 'offset', 'start')
+
+
+def _distance_two(template):
+    def expression(tab_first, values):
+        return template if values.get('distance') else '0'
+    return expression
+
+
+AUTO_WIDTH = FormulaGraph(INPUTS, [
+    Formula('adjusted_depth', ('depth', 'kerf'),
+            lambda m, v: m.abs(v['depth']) - m.abs(v['kerf']/2),
+            '(abs({depth}) - abs({kerf}/2))',
+            'kerf adjusted depth of cuts'),
+    Formula('adjusted_length', ('face_length', 'margin'),
+            lambda m, v: v['face_length'] - v['margin']*2,
+            '(({face_length}) - ({margin})*2)',
+            'adjusted length of the face without margins'),
+    Formula('fingers', ('adjusted_length', 'default_width'),
+            lambda m, v: (m.ceil(m.maximum(3, m.floor(v['adjusted_length']/v['default_width']))/2)*2)-1,
+            '((ceil(max(3; floor({adjusted_length} / {default_width}))/2)*2)-1)',
+            'total number of fingers across the jointed faces'),
+    Formula('finger_length', ('adjusted_length', 'fingers'),
+            lambda m, v: v['adjusted_length']/v['fingers'],
+            '({adjusted_length}/{fingers})',
+            'nominal length of each finger'),
+    Formula('pattern_distance', ('adjusted_length', 'finger_length', 'tab_first'),
+            lambda m, v: v['adjusted_length'] - v['finger_length']*m.where(v['tab_first'], 3, 5),
+            branch('(({adjusted_length} - {finger_length}*3))',
+                   '(({adjusted_length} - {finger_length}*5))'),
+            'distance over which to place the rectangular pattern.'),
+    Formula('finger_distance', ('finger_length', 'fingers'),
+            lambda m, v: v['finger_length']*v['fingers'],
+            '({finger_length} * {fingers}/1{units})',
+            'nominal distance of notch placement'),
+    Formula('adjusted_finger_length', ('finger_length', 'kerf'),
+            lambda m, v: m.abs(v['finger_length']) - m.abs(v['kerf']),
+            '(abs({finger_length}) - abs({kerf}))',
+            'kerf adjusted length of notches that are cut'),
+    Formula('notches', ('fingers', 'tab_first'),
+            lambda m, v: m.floor(v['fingers']/2) - m.where(v['tab_first'], 0, 1),
+            branch('floor(({fingers}/1{units})/2)',
+                   'floor(({fingers}/1{units})/2) - 1'),
+            'number of notches to cut in face',
+            parameter=False),
+    Formula('distance_two', ('distance', 'adjusted_depth', 'edge_margin'),
+            lambda m, v: m.where(v['distance'] != 0,
+                                 v['distance'] - v['adjusted_depth'] - m.abs(v['edge_margin'])*2, 0),
+            _distance_two('({distance} - {adjusted_depth} - abs({edge_margin})*2)'),
+            'distance to second face.',
+            name='second_distance'),
+    Formula('offset', ('margin', 'adjusted_finger_length', 'kerf'),
+            lambda m, v: (v['margin'] + v['adjusted_finger_length']) + v['kerf']/2,
+            '({margin} + {adjusted_finger_length}) + {kerf}/2',
+            'offset point for start of the finger distance'),
+    Formula('start', ('offset', 'finger_length', 'kerf', 'tab_first'),
+            lambda m, v: v['offset'] + m.where(v['tab_first'], 0, v['finger_length']) + v['kerf'],
+            branch('({offset} + {kerf})',
+                   '({offset} + {finger_length} + {kerf})'),
+            'start point for first notch')
+])
+
+CONSTANT_WIDTH = AUTO_WIDTH.overlay([
+    Formula('adjusted_depth', ('depth', 'kerf'),
+            lambda m, v: m.abs(v['depth']) - m.abs(v['kerf'])/2,
+            '(abs({depth}) - abs({kerf})/2)',
+            'kerf adjusted depth of notch'),
+    Formula('adjusted_length', ('face_length', 'margin'),
+            lambda m, v: v['face_length'] - v['margin']*2,
+            '({face_length}) - ({margin})*2',
+            'adjusted length of the face without margins'),
+    Formula('finger_length', ('default_width', 'kerf'),
+            lambda m, v: v['default_width'] - v['kerf'],
+            '({default_width} - {kerf})',
+            'nominal length of each finger'),
+    Formula('finger_distance', ('default_width', 'fingers'),
+            lambda m, v: v['default_width']*v['fingers'],
+            '({default_width} * {fingers}/1{units})',
+            'full distance of notch placement'),
+    Formula('pattern_distance', ('finger_distance', 'default_width', 'tab_first'),
+            lambda m, v: v['finger_distance'] - v['default_width']*m.where(v['tab_first'], 3, 1),
+            branch('(({finger_distance} - {default_width}*3))',
+                   '({finger_distance} - {default_width})'),
+            'distance over which to place the rectangular pattern.'),
+    Formula('notches', ('fingers', 'tab_first'),
+            lambda m, v: m.where(v['tab_first'], m.floor(v['fingers']/2), m.ceil(v['fingers']/2)),
+            branch('floor(({fingers}/1{units})/2)',
+                   'ceil(({fingers}/1{units})/2)'),
+            'number of notches to cut in face',
+            parameter=False),
+    Formula('distance_two', ('distance', 'adjusted_depth', 'edge_margin'),
+            lambda m, v: m.where(v['distance'] != 0,
+                                 v['distance'] - v['adjusted_depth'] - m.abs(v['edge_margin']*2), 0),
+            _distance_two('({distance} - {adjusted_depth} - abs({edge_margin}*2))'),
+            'distance to second face.',
+            name='second_distance'),
+    Formula('offset', ('face_length', 'finger_distance', 'kerf', 'tab_first'),
+            lambda m, v: (v['face_length'] - v['finger_distance'])/2 + m.where(v['tab_first'], -1, 1)*v['kerf']/2,
+            branch('({face_length} - {finger_distance})/2 - {kerf}/2',
+                   '({face_length} - {finger_distance})/2 + {kerf}/2'),
+            'offset point for start of the finger distance'),
+    Formula('start', ('offset', 'default_width', 'kerf', 'tab_first'),
+            lambda m, v: m.where(v['tab_first'], v['offset'] + v['default_width'] + v['kerf'], v['offset']),
+            branch('{offset} + {default_width} + {kerf}',
+                   '{offset}'),
+            'start point for first notch')
+])
+
+# The number of fingers is an input for this layout
+CONSTANT_COUNT = AUTO_WIDTH.overlay(inputs=COUNT_INPUTS, remove=('fingers',))
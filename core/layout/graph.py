@@ -0,0 +1,186 @@
+""" A declarative graph of the formulas that make up a finger layout.
+
+    Each derived quantity is declared once as a Formula, with the names
+    of the values it depends on, a numeric function and a Fusion
+    expression template. The graph evaluates the numeric values, builds
+    the expression strings for the parametric features, and orders the
+    formulas so that every one of them comes after its dependencies.
+    """
+import math
+import string
+
+from collections import namedtuple
+
+# key: the name used within the graph
+# source: the attribute of the InputReader that holds the input
+# name: the suffix of the model parameter created for the input
+# parameter: False for inputs that are not created as model parameters
+Input = namedtuple('Input', ['key', 'source', 'name', 'comment', 'parameter'])
+Input.__new__.__defaults__ = (True,)
+
+# value: function of a math backend and the dependency values
+# expression: a template, or a function of tab_first and the input
+#             values that returns a template
+# parameter: False for values that are only used as an expression
+Formula = namedtuple('Formula', ['key', 'depends', 'value', 'expression',
+                                 'comment', 'name', 'parameter'])
+Formula.__new__.__defaults__ = (None, True)
+
+
+class ScalarMath:
+    """ The math backend for evaluating a single layout.
+        """
+    ceil = staticmethod(math.ceil)
+    floor = staticmethod(math.floor)
+    maximum = staticmethod(max)
+    abs = staticmethod(abs)
+
+    @staticmethod
+    def where(condition, if_true, if_false):
+        return if_true if condition else if_false
+
+
+class GraphError(Exception): pass
+
+
+def branch(tab_first_template, tab_last_template):
+    """ Choose an expression template by whether the face starts
+        with a tab.
+        """
+    def expression(tab_first, values):
+        return tab_first_template if tab_first else tab_last_template
+    return expression
+
+
+def _template_fields(template):
+    return {field for _, field, _, _ in string.Formatter().parse(template) if field}
+
+
+class FormulaGraph:
+
+    def __init__(self, inputs, formulas):
+        self.inputs = tuple(inputs)
+        self.formulas = tuple(formulas)
+        self.input_keys = tuple(input_.key for input_ in self.inputs)
+        self.by_key = {formula.key: formula for formula in self.formulas}
+
+        self.order = self._sort()
+        self.dependents = self._dependents()
+
+    def _sort(self):
+        """ Sort the formulas topologically; formulas that do not depend
+            on each other keep the order in which they were declared.
+            """
+        known = set(self.input_keys) | {'tab_first'}
+        remaining = list(self.formulas)
+        ordered = []
+
+        while remaining:
+            for formula in remaining:
+                if all(depend in known for depend in formula.depends):
+                    break
+            else:
+                missing = {depend for formula in remaining for depend in formula.depends
+                           if depend not in known and depend not in self.by_key}
+                if missing:
+                    raise GraphError('undefined values: {}'.format(', '.join(sorted(missing))))
+                raise GraphError('circular formulas: {}'.format(', '.join(f.key for f in remaining)))
+
+            remaining.remove(formula)
+            ordered.append(formula)
+            known.add(formula.key)
+
+        return tuple(ordered)
+
+    def _dependents(self):
+        dependents = {key: set() for key in self.input_keys + ('tab_first',)}
+        for formula in self.order:
+            dependents[formula.key] = set()
+            for depend in formula.depends:
+                dependents[depend].add(formula.key)
+        return dependents
+
+    def overlay(self, formulas=(), inputs=None, remove=()):
+        """ A new graph that replaces or adds formulas by key, and
+            optionally drops formulas or replaces the inputs.
+            """
+        replacements = {formula.key: formula for formula in formulas}
+        merged = [replacements.pop(formula.key, formula) for formula in self.formulas
+                  if formula.key not in remove]
+        merged.extend(formula for formula in formulas if formula.key in replacements)
+        return FormulaGraph(self.inputs if inputs is None else inputs, merged)
+
+    def affected(self, changed):
+        """ The keys of every formula that depends, directly or not,
+            on one of the changed values.
+            """
+        affected = set()
+        pending = list(changed)
+        while pending:
+            for key in self.dependents.get(pending.pop(), ()):
+                if key not in affected:
+                    affected.add(key)
+                    pending.append(key)
+        return affected
+
+    def evaluate(self, values, m=ScalarMath, previous=None, changed=None):
+        """ Evaluate the formulas from the input values, which include
+            tab_first. When the previous results and the keys of the
+            changed inputs are given, only the formulas that depend on
+            those inputs are recalculated.
+            """
+        results = dict(values)
+
+        if previous is not None and changed is not None:
+            affected = self.affected(changed)
+            for formula in self.order:
+                if formula.key not in affected:
+                    results[formula.key] = previous[formula.key]
+        else:
+            affected = None
+
+        for formula in self.order:
+            if affected is None or formula.key in affected:
+                results[formula.key] = formula.value(m, results)
+
+        return results
+
+    def name(self, key):
+        formula = self.by_key.get(key)
+        if formula and formula.name:
+            return formula.name
+        for input_ in self.inputs:
+            if input_.key == key:
+                return input_.name
+        return key
+
+    def expressions(self, name, units, tab_first, values):
+        """ Build the Fusion expressions for every formula. name is a
+            callable that maps a parameter name suffix to the full name
+            of the model parameter.
+            """
+        expressions = {}
+        for formula in self.order:
+            template = formula.expression
+            if callable(template):
+                template = template(tab_first, values)
+            fields = {field: name(self.name(field)) for field in _template_fields(template)
+                      if field != 'units'}
+            expressions[formula.key] = template.format(units=units, **fields)
+        return expressions
+
+    def kept(self, bound):
+        """ The keys of the formulas that optimizing the expressions must
+            not inline: the bound formulas, and the formulas that are
+            only used as an expression.
+            """
+        return {formula.key for formula in self.formulas
+                if formula.key in bound or not formula.parameter}
+
+    @property
+    def parameters(self):
+        """ The keys of the inputs and formulas that are created as model
+            parameters, in the order that they need to be created.
+            """
+        return (tuple(input_.key for input_ in self.inputs if input_.parameter) +
+                tuple(formula.key for formula in self.order if formula.parameter))
@@ -0,0 +1,154 @@
+""" The cuts of a finger layout along a face, as a sorted set of
+    non-overlapping intervals.
+
+    The bounds are kept flat in an array('d') -- start, end, start,
+    end -- so a layout with hundreds of notches is a single small
+    buffer that can be compared, complemented or stored in a face
+    attribute without touching any sketch geometry. The buffer supports
+    the buffer protocol, so numpy.frombuffer(intervals.bounds) views it
+    without a copy.
+    """
+import json
+import math
+
+from array import array
+from bisect import bisect_right
+
+# Relative to the face length
+EPSILON = 1e-9
+
+
+class Intervals:
+
+    __slots__ = ('length', 'bounds')
+
+    def __init__(self, length, pairs=()):
+        self.length = float(length)
+        self.bounds = array('d')
+
+        # Clip to the face, drop anything empty, and merge overlaps
+        for start, end in sorted((max(0.0, start), min(self.length, end)) for start, end in pairs):
+            if end <= start:
+                continue
+            if self.bounds and start <= self.bounds[-1]:
+                self.bounds[-1] = max(self.bounds[-1], end)
+            else:
+                self.bounds.extend((start, end))
+
+    @classmethod
+    def _from_bounds(cls, length, bounds):
+        intervals = cls.__new__(cls)
+        intervals.length = float(length)
+        intervals.bounds = array('d', bounds)
+        return intervals
+
+    @classmethod
+    def from_layout(cls, layout, face_length, tab_first, corners=True):
+        """ The cuts that the features for a Layout remove from a face:
+            the corner notches at both ends, when the face starts with a
+            notch and corners is set, and the patterned finger notches.
+            """
+        pairs = []
+
+        if corners and layout.offset and not tab_first:
+            pairs.append((0, layout.offset))
+            pairs.append((face_length - layout.offset, face_length))
+
+        notches = int(layout.notches)
+        if notches > 0 and not math.isnan(layout.start):
+            spacing = layout.pattern_distance/(notches - 1) if notches > 1 else 0
+            for notch in range(notches):
+                start = layout.start + spacing*notch
+                pairs.append((start, start + layout.adjusted_finger_length))
+
+        return cls(face_length, pairs)
+
+    def complement(self):
+        """ The intervals of the face that are not cut; the cuts of the
+            mating face.
+            """
+        edges = array('d', [0.0])
+        edges.extend(self.bounds)
+        edges.append(self.length)
+        return Intervals._from_bounds(self.length, [value for start, end in zip(edges[::2], edges[1::2])
+                                                    if end > start for value in (start, end)])
+
+    def reversed(self):
+        """ The same cuts, measured from the other end of the face.
+            """
+        return Intervals._from_bounds(self.length, [self.length - value for value in reversed(self.bounds)])
+
+    def intersects(self, start, end):
+        """ Whether any cut overlaps the open interval between start
+            and end. Overlaps within rounding error of the face length
+            are ignored, so that cuts which only touch don't count.
+            """
+        tolerance = EPSILON*self.length
+        start, end = start + tolerance, end - tolerance
+        if end <= start:
+            return False
+
+        index = bisect_right(self.bounds, start)
+        if index % 2:
+            return True
+        return index < len(self.bounds) and self.bounds[index] < end
+
+    def overlaps(self, other):
+        """ Whether any cut overlaps a cut in another set of intervals
+            along the same face, within rounding error.
+            """
+        return any(other.intersects(start, end) for start, end in self)
+
+    @property
+    def total(self):
+        return sum(end - start for start, end in self)
+
+    def __len__(self):
+        return len(self.bounds)//2
+
+    def __iter__(self):
+        bounds = self.bounds
+        for index in range(0, len(bounds), 2):
+            yield bounds[index], bounds[index + 1]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Intervals._from_bounds(self.length, [value for pair in list(self)[index] for value in pair])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('interval index out of range')
+        return self.bounds[index*2], self.bounds[index*2 + 1]
+
+    def __eq__(self, other):
+        if not isinstance(other, Intervals):
+            return NotImplemented
+        return self.length == other.length and self.bounds == other.bounds
+
+    def __repr__(self):
+        return 'Intervals({!r}, {!r})'.format(self.length, list(self))
+
+    def to_bytes(self):
+        """ The face length followed by the bounds, as native doubles.
+            """
+        return array('d', [self.length]).tobytes() + self.bounds.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        values = array('d')
+        values.frombytes(data)
+        return cls._from_bounds(values[0], values[1:])
+
+    def as_dict(self):
+        return {'length': self.length, 'bounds': self.bounds.tolist()}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls._from_bounds(data['length'], data['bounds'])
+
+    def to_json(self):
+        return json.dumps(self.as_dict())
+
+    @classmethod
+    def from_json(cls, text):
+        return cls.from_dict(json.loads(text))
@@ -0,0 +1,196 @@
+""" An optimizer for the sets of parameter expressions that TabGen
+    creates in parametric mode. Intermediate parameters that are only
+    used once are inlined into the expression that uses them, and
+    constant sub-expressions are folded, so that Fusion has fewer
+    parameters and dimensions to recompute.
+    """
+from collections import Counter
+
+from .evaluator import Binary
+from .evaluator import Call
+from .evaluator import ExpressionError
+from .evaluator import FUNCTIONS
+from .evaluator import Name
+from .evaluator import Number
+from .evaluator import OPERATORS
+from .evaluator import Unary
+from .evaluator import dependency_order
+from .evaluator import parse
+
+PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2, '^': 4}
+UNARY_PRECEDENCE = 3
+ATOM_PRECEDENCE = 5
+
+
+def _precedence(node):
+    if isinstance(node, Binary):
+        return PRECEDENCE[node.op]
+    if isinstance(node, Unary):
+        return UNARY_PRECEDENCE
+    if isinstance(node, Number) and node.value < 0:
+        # Negative constants are always wrapped when they are operands
+        return 0
+    return ATOM_PRECEDENCE
+
+
+def _number(value):
+    # Twelve significant digits hides the floating point rounding
+    return '{:.12g}'.format(value)
+
+
+def _wrap(node, needs_parens):
+    text = to_string(node)
+    return '({})'.format(text) if needs_parens else text
+
+
+def to_string(node):
+    """ Print an expression tree in the Fusion expression dialect, with
+        only the parentheses that are needed.
+        """
+    if isinstance(node, Number):
+        return '{}{}'.format(_number(node.value), node.unit or '')
+
+    if isinstance(node, Name):
+        return node.id
+
+    if isinstance(node, Unary):
+        return '{}{}'.format(node.op, _wrap(node.operand, _precedence(node.operand) < UNARY_PRECEDENCE))
+
+    if isinstance(node, Binary):
+        precedence = PRECEDENCE[node.op]
+        if node.op == '^':
+            left = _wrap(node.left, _precedence(node.left) <= precedence)
+            right = _wrap(node.right, _precedence(node.right) < UNARY_PRECEDENCE)
+            return '{}^{}'.format(left, right)
+
+        left = _wrap(node.left, _precedence(node.left) < precedence)
+        right = _wrap(node.right, _precedence(node.right) <= precedence)
+        separator = ' {} '.format(node.op) if precedence == 1 else node.op
+        return '{}{}{}'.format(left, separator, right)
+
+    return '{}({})'.format(node.func, '; '.join(to_string(arg) for arg in node.args))
+
+
+def _is(node, value):
+    return isinstance(node, Number) and not node.unit and node.value == value
+
+
+def _plain(node):
+    return isinstance(node, Number) and not node.unit
+
+
+def fold(node):
+    """ Fold constant sub-expressions and remove additions of zero and
+        multiplications by one.
+
+        Constants with units are never folded, so an expression keeps
+        the units that it was written with; folding them would leave a
+        bare number that Fusion reads in the design's units.
+        """
+    if isinstance(node, Unary):
+        operand = fold(node.operand)
+        if node.op == '+':
+            return operand
+        if isinstance(operand, Number):
+            return Number(-operand.value, operand.unit)
+        if isinstance(operand, Unary):
+            return operand.operand
+        return Unary(node.op, operand)
+
+    if isinstance(node, Binary):
+        left = fold(node.left)
+        right = fold(node.right)
+
+        if _plain(left) and _plain(right):
+            try:
+                return Number(OPERATORS[node.op](left.value, right.value), None)
+            except (ArithmeticError, ExpressionError):
+                return Binary(node.op, left, right)
+
+        if node.op == '+' and _is(left, 0):
+            return right
+        if node.op in '+-' and _is(right, 0):
+            return left
+        if node.op == '*' and _is(left, 1):
+            return right
+        if node.op in '*/' and _is(right, 1):
+            return left
+        if node.op == '*' and (_is(left, 0) or _is(right, 0)):
+            return Number(0, None)
+
+        return Binary(node.op, left, right)
+
+    if isinstance(node, Call):
+        args = tuple(fold(arg) for arg in node.args)
+
+        if all(_plain(arg) for arg in args):
+            func = FUNCTIONS[node.func][0]
+            try:
+                return Number(func(*[arg.value for arg in args]), None)
+            except (ArithmeticError, ValueError):
+                pass
+
+        if node.func == 'abs' and isinstance(args[0], Call) and args[0].func == 'abs':
+            return args[0]
+
+        return Call(node.func, args)
+
+    return node
+
+
+def substitute(node, replacements):
+    """ Replace references to the named parameters with their
+        expression trees.
+        """
+    if isinstance(node, Name):
+        return replacements.get(node.id, node)
+    if isinstance(node, Unary):
+        return Unary(node.op, substitute(node.operand, replacements))
+    if isinstance(node, Binary):
+        return Binary(node.op, substitute(node.left, replacements), substitute(node.right, replacements))
+    if isinstance(node, Call):
+        return Call(node.func, tuple(substitute(arg, replacements) for arg in node.args))
+    return node
+
+
+def _uses(node, counts):
+    if isinstance(node, Name):
+        counts[node.id] += 1
+    elif isinstance(node, Unary):
+        _uses(node.operand, counts)
+    elif isinstance(node, Binary):
+        _uses(node.left, counts)
+        _uses(node.right, counts)
+    elif isinstance(node, Call):
+        for arg in node.args:
+            _uses(arg, counts)
+    return counts
+
+
+def optimize(expressions, keep, max_uses=1):
+    """ Optimize a set of named expressions.
+
+        Names in keep are always kept, and are never inlined. Any other
+        name that is used at most max_uses times is inlined into the
+        expressions that use it, and dropped. Returns the optimized
+        expressions that are kept, in dependency order, and the set of
+        names that were inlined.
+        """
+    trees = {name: parse(expression) for name, expression in expressions.items()}
+    counts = Counter()
+    for tree in trees.values():
+        _uses(tree, counts)
+
+    inlined = {name for name in expressions
+               if name not in keep and counts[name] <= max_uses}
+
+    optimized = {}
+    replacements = {}
+    for name in dependency_order(expressions):
+        tree = fold(substitute(trees[name], replacements))
+        if name in inlined:
+            replacements[name] = tree
+        else:
+            optimized[name] = to_string(tree)
+
+    return optimized, inlined
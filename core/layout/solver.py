@@ -0,0 +1,137 @@
+""" Plan the finger joints for every edge of a box at once.
+
+    Mating edges have to use the same number of fingers, and one of
+    them has to start with a tab while the other starts with a notch.
+    The edges are grouped by the pairs that mate, every group gets the
+    odd finger count that keeps its fingers closest to the target width,
+    and the tab placement is alternated across each pair. The result is
+    a Constant Count layout for each edge.
+    """
+import math
+
+from collections import deque
+from collections import namedtuple
+
+from .engine import constant_count
+
+EdgePlan = namedtuple('EdgePlan', ['fingers', 'tab_first', 'layout'])
+
+
+class SolverError(Exception): pass
+
+
+class UnknownEdge(SolverError, ValueError): pass
+
+
+class PhaseConflict(SolverError): pass
+
+
+def _groups(names, mates):
+    """ Union-find over the mating pairs; returns the edges of each
+        group, in the order the edges were given.
+        """
+    parent = {name: name for name in names}
+
+    def find(name):
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    for first, second in mates:
+        parent[find(first)] = find(second)
+
+    groups = {}
+    for name in names:
+        groups.setdefault(find(name), []).append(name)
+    return list(groups.values())
+
+
+def _candidates(lengths, width):
+    """ The odd finger counts, of at least three, nearest to the target
+        width for each of the lengths.
+        """
+    counts = {3}
+    for length in lengths:
+        estimate = length/width
+        for count in (math.floor(estimate), math.ceil(estimate)):
+            counts.add(max(3, count if count % 2 else count - 1))
+            counts.add(max(3, count if count % 2 else count + 1))
+    return sorted(counts)
+
+
+def best_count(lengths, width):
+    """ The odd finger count that minimizes the squared difference
+        between the finger lengths and the target width.
+        """
+    return min(_candidates(lengths, width),
+               key=lambda count: sum((length/count - width)**2 for length in lengths))
+
+
+def phases(names, mates, tab_first=None):
+    """ Alternate the tab placement across every mating pair. Edges in
+        tab_first keep their placement; otherwise the first edge of each
+        group starts with a tab. A group that can't alternate, such as
+        three edges that all mate with each other, is a PhaseConflict.
+        Pinning an edge that isn't in names is an UnknownEdge.
+        """
+    neighbours = {name: [] for name in names}
+    for first, second in mates:
+        neighbours[first].append(second)
+        neighbours[second].append(first)
+
+    pinned = dict(tab_first or {})
+    for name in pinned:
+        if name not in neighbours:
+            raise UnknownEdge(name)
+    placed = {}
+    starts = [name for name in names if name in pinned] + [name for name in names if name not in pinned]
+
+    for start in starts:
+        if start in placed:
+            continue
+        placed[start] = pinned.get(start, True)
+        pending = deque([start])
+        while pending:
+            name = pending.popleft()
+            for neighbour in neighbours[name]:
+                phase = not placed[name]
+                if neighbour not in placed:
+                    placed[neighbour] = pinned.get(neighbour, phase)
+                    pending.append(neighbour)
+                if placed[neighbour] != phase:
+                    raise PhaseConflict('{} and {} can\'t both start with {}'.format(
+                        name, neighbour, 'a tab' if placed[name] else 'a notch'))
+    return placed
+
+
+def solve_box(edges, mates, width, depth, kerf=0, margin=0, distance=0,
+              edge_margin=0, tab_first=None):
+    """ Plan every edge of a box. edges maps the name of each edge to its
+        length, and mates is a list of the pairs of edge names that are
+        joined together. tab_first optionally pins the tab placement of
+        some of the edges. Lengths are in cm.
+
+        Returns a dict of the EdgePlan for each edge, with the number of
+        fingers, the tab placement and its Constant Count layout.
+        """
+    if width <= 0:
+        raise SolverError('the target finger width has to be greater than zero')
+
+    names = list(edges)
+    for pair in mates:
+        for name in pair:
+            if name not in edges:
+                raise UnknownEdge(name)
+
+    placed = phases(names, mates, tab_first)
+
+    plans = {}
+    for group in _groups(names, mates):
+        fingers = best_count([edges[name] - margin*2 for name in group], width)
+        for name in group:
+            plans[name] = EdgePlan(fingers, placed[name],
+                                   constant_count(edges[name], fingers, depth, kerf=kerf,
+                                                  margin=margin, distance=distance,
+                                                  edge_margin=edge_margin, tab_first=placed[name]))
+    return {name: plans[name] for name in names}
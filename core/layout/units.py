@@ -0,0 +1,40 @@
+""" Length unit conversions, done locally instead of through Fusion's
+    UnitsManager. Fusion keeps every length in cm internally, and the
+    table is the length of each unit in cm.
+    """
+from functools import lru_cache
+
+LENGTH_UNITS = {
+    'mm': 0.1,
+    'cm': 1.0,
+    'm': 100.0,
+    'in': 2.54,
+    'ft': 30.48
+}
+
+INTERNAL_UNITS = 'cm'
+
+
+class UnknownUnits(KeyError): pass
+
+
+def is_length(units):
+    return units in LENGTH_UNITS
+
+
+@lru_cache(maxsize=256)
+def convert(value, from_units, to_units=INTERNAL_UNITS):
+    """ Convert a length from one unit to another.
+        """
+    try:
+        return value * LENGTH_UNITS[from_units] / LENGTH_UNITS[to_units]
+    except KeyError as err:
+        raise UnknownUnits(err.args[0])
+
+
+def to_internal(value, units):
+    return convert(value, units, INTERNAL_UNITS)
+
+
+def from_internal(value, units):
+    return convert(value, INTERNAL_UNITS, units)
@@ -1,15 +1,28 @@
 from .. import definitions as defs
 
+from . import graphics
+
+from .fingers import CornerConflict
 from .fingers import create
+from .fingers import plan_estimate
+from .fingers import plan_layout
+from .fingers import preview_fidelity
+from .fingers import validate_parameters
 from .createproperty import create_property
 from .auto import create_auto_width
 from .constant import create_constant_width
 from .constant import create_constant_count
 
 __all__ = [
+    CornerConflict,
     create,
     create_property,
+    graphics,
+    plan_estimate,
+    plan_layout,
+    preview_fidelity,
     create_auto_width,
     create_constant_count,
-    create_constant_width
+    create_constant_width,
+    validate_parameters
 ]
@@ -25,8 +25,10 @@ class PrimaryAxisMissing(Exception): pass
 
 class FingerManager:
 
-    def __init__(self, inputs, properties, border):
+    def __init__(self, inputs, properties, border, fidelity=None):
         self.inputs = inputs
+        # A reduced preview; None builds the complete joint
+        self.fidelity = fidelity
         self.face = properties.face
         self.alias = properties.alias
         self.border = border
@@ -36,6 +38,8 @@ class FingerManager:
         self.properties = properties
 
     def configure_secondary_axis(self, input_, secondary, squantity):
+        if self.fidelity and not self.fidelity.secondary:
+            return
         if self.properties.distance_two.value and secondary and secondary.isValid:
             value = abs(self.properties.distance_two.value)
             second_distance = vi.createByReal(value)
@@ -386,6 +390,10 @@ class FingerManager:
     def duplicate_finger(self, body, primary, secondary, finger_cut):
         quantity = self.properties.notches.value
         distance = self.properties.pattern_distance.value
+        if self.fidelity and self.fidelity.notches < quantity:
+            # Keep the spacing of the complete pattern
+            distance = distance*(self.fidelity.notches - 1)/(quantity - 1)
+            quantity = self.fidelity.notches
         dname = '{} Finger Duplicate Pattern'.format(self.name)
         return self.duplicate(dname, [finger_cut], quantity, distance,
                               self.inputs.interior.value + 2,
@@ -428,8 +436,8 @@ class FingerManager:
         else:
             start = self.border.top.left
 
-        secondary = fusion.perpendicular_edge_from_vertex(self.face,
-                                                          start.vertex).edge
+        secondary = self.inputs.cache.perpendicular_edge(self.face,
+                                                         start.vertex).edge
         if not secondary:
             start = start.geometry
             end = Point3D.create(start.x, start.y, start.z - 10)
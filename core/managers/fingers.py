@@ -1,7 +1,15 @@
+from collections import ChainMap
 from collections import namedtuple
 
 from .. import definitions as defs
 from .. import fusion
+from ..layout import batch
+from ..layout import corners
+from ..layout import cost
+from ..layout import engine
+from ..layout import evaluator
+from ..layout import units as length_units
+from ..layout import Intervals
 
 from .fingermanager import FingerManager
 
@@ -9,18 +17,150 @@ class InvalidFaceSelected(Exception): pass
 
 class FaceNotExists(Exception): pass
 
+class CornerConflict(Exception): pass
 
-def create(inputs, properties, preview=True):
+
+class DesignParameters:
+    """ Resolve references to existing model and user parameters,
+        converted to the units that the expressions are evaluated in.
+        """
+
+    def __init__(self, design, units):
+        self.parameters = design.allParameters
+        self.units = units
+
+    def __getitem__(self, name):
+        param = self.parameters.itemByName(name)
+        if not param:
+            raise KeyError(name)
+        if length_units.is_length(param.unit):
+            return length_units.from_internal(param.value, self.units)
+        return param.value
+
+
+def validate_parameters(properties):
+    """ Evaluate every generated expression that will be assigned to a
+        model parameter, so that bad expressions are reported before
+        anything is added to the timeline.
+
+        The inputs can use anything that Fusion understands, so their
+        expressions aren't parsed; they are seeded with the values that
+        Fusion already computed for them.
+        """
+    design = properties.app.activeProduct
+    units = design.unitsManager.defaultLengthUnits
+
+    seeds = {}
+    for input_ in properties.graph.inputs:
+        item = getattr(properties, input_.key)
+        # Lengths are read from the dialog in cm
+        seeds[item.name] = length_units.from_internal(item.value, units) if item.unit_type else item.value
+
+    expressions = {}
+    for formula in properties.graph.formulas:
+        if formula.key not in properties.inlined:
+            item = getattr(properties, formula.key)
+            expressions[item.name] = item.expression
+
+    return evaluator.evaluate_all(expressions, ChainMap(seeds, DesignParameters(design, units)), units)
+
+
+def plan_layout(inputs):
+    """ The layout for the current input values, evaluated without
+        creating any finger properties or model parameters.
+        """
+    graph = batch.GRAPHS[inputs.finger_type]
+    values = {input_.key: abs(getattr(inputs, input_.source).value) for input_ in graph.inputs}
+    values['tab_first'] = inputs.tab_first
+    return engine.layout(graph, values)
+
+
+def plan_estimate(inputs, layout):
+    """ The most that creating the layout can cost, with every parameter
+        of the finger type created.
+        """
+    graph = batch.GRAPHS[inputs.finger_type]
+    return cost.estimate(layout, inputs.tab_first, len(graph.parameters), inputs.interior.value)
+
+
+def preview_fidelity(inputs, instances):
+    """ The level of detail that the fingers can be previewed at within
+        the limits, or None if they can't be previewed. It is decided
+        from the planned layout, before any properties are created.
+        """
+    graph = batch.GRAPHS[inputs.finger_type]
+    return cost.fidelity(plan_layout(inputs), inputs.tab_first, len(graph.parameters),
+                         inputs.interior.value, instances)
+
+
+def plan_joints(inputs, properties):
+    """ Where the cuts for the face, and each copy of them that is
+        patterned to the interior walls and the secondary face, will be
+        placed in world coordinates, so that later joints on the body
+        can be checked against them. Only the frame of the face is
+        needed, so nothing has to be created first.
+        """
+    frame = inputs.cache.frame(properties.face)
+    depth = properties.adjusted_depth.value
+    offsets = corners.copy_offsets(properties.edge_margin.value, properties.distance_two.value,
+                                   inputs.interior.value)
+
+    # The corners are only patterned to the secondary face
+    inner = Intervals.from_layout(properties.layout, properties.face_length.value,
+                                  properties.tab_first, corners=False)
+
+    joints = []
+    for copy, offset in enumerate(offsets):
+        cuts = properties.cuts
+        if copy == 0:
+            name = properties.name
+        elif copy == len(offsets) - 1:
+            name = '{} (secondary)'.format(properties.name)
+        else:
+            name = '{} (interior {})'.format(properties.name, copy)
+            cuts = inner
+        origin = tuple(point + axis*offset for point, axis in zip(frame.origin, frame.inward))
+        joints.append(corners.Joint(name, origin, tuple(frame.direction), frame.width, depth, cuts))
+    return joints
+
+
+def check_corners(face, joints):
+    """ Make sure that the joints don't cut into a corner that has
+        already been cut by another joint on the same body.
+        """
+    saved = fusion.saved_joints(face.body)
+    for joint in joints:
+        found = corners.conflicts(joint, saved)
+        if found:
+            names = ', '.join(sorted({conflict.other.name for conflict in found}))
+            raise CornerConflict('{} and {} both cut into the same corner; change Tab First '
+                                 'or the margin of one of the joints.'.format(joint.name, names))
+
+
+def create(inputs, properties, preview=True, fidelity=None):
     face = inputs.selected_face
 
+    if properties.parametric:
+        validate_parameters(properties)
+
+    # Checking the planned cuts is much cheaper than undoing the
+    # features after they fail.
+    joints = plan_joints(inputs, properties)
+    check_corners(face, joints)
+
     sketch = initialize_sketch(face)
     border = create_sketch_border(sketch)
 
-    manager = FingerManager(inputs, properties, border)
+    manager = FingerManager(inputs, properties, border, fidelity)
     properties = manager.draw(sketch)
     if not preview:
         manager.save(properties)
 
+        # Only joints that were built are recorded, with the feature
+        # that shows whether they still exist
+        fusion.save_joints(face.body, [joint._replace(feature=properties.finger_cut.name)
+                                       for joint in joints])
+
 
 def create_sketch_border(sketch):
     lines = sketch.sketchCurves.sketchLines
@@ -0,0 +1,164 @@
+from collections import namedtuple
+
+from adsk.core import ValueInput as vi
+
+from .. import fusion
+from ..layout import formulas
+from ..layout import optimize
+from ..layout import Intervals
+from ..layout import Layout
+
+Property = namedtuple('Property', ['name', 'value', 'expression', 'comment', 'unit_type'])
+
+
+class FingerStrategy:
+    """ The properties of a finger joint, computed from a formula
+        graph. Each type of finger layout is a subclass that sets
+        the graph to use.
+        """
+
+    graph = None
+
+    # The parameters that sketch dimensions and features refer to by
+    # name; these are always created.
+    bound = formulas.BOUND
+
+    # Intermediate parameters used this many times or fewer are inlined
+    # into the expressions that use them.
+    inline_uses = 1
+
+    def __init__(self, app, ui, inputs):
+        self.app = app
+        self.ui = ui
+
+        self.parametric = not inputs.parametric
+        self.tab_first = inputs.tab_first
+        self.face = inputs.selected_face
+        self.alternate = inputs.selected_edge
+        self.preview_enabled = inputs.preview
+        self.units = self.app.activeProduct.unitsManager
+
+        name = inputs.name
+        orientation = inputs.cache.orientation(self.face)
+        face_id = fusion.add_face(self.face)
+
+        self.name = '{name} {orientation}{face_num}'.format(name=name,
+                                                            orientation=orientation,
+                                                            face_num=face_id)
+        self.alias = fusion.clean_string(self.name)
+
+        for input_ in self.graph.inputs:
+            setattr(self, input_.key, self._get_param(getattr(inputs, input_.source),
+                                                      input_.name, input_.comment, save=False))
+
+        values = {input_.key: getattr(self, input_.key).value for input_ in self.graph.inputs}
+        values['tab_first'] = self.tab_first
+        self.values = self.graph.evaluate(values)
+
+        # The expressions are only needed for the parametric features.
+        # Without them, nothing refers to the intermediate parameters.
+        if self.parametric:
+            expressions = self.graph.expressions(self._name, self.units.defaultLengthUnits,
+                                                 self.tab_first, values)
+            expressions, self.inlined = self._optimize(expressions)
+        else:
+            expressions = {}
+            self.inlined = {formula.key for formula in self.graph.formulas
+                            if formula.parameter and formula.key not in self.bound}
+
+        unit_type = self.units.defaultLengthUnits
+        for formula in self.graph.order:
+            setattr(self, formula.key, Property(self._name(self.graph.name(formula.key)),
+                                                self.values[formula.key],
+                                                expressions.get(formula.key),
+                                                formula.comment,
+                                                unit_type))
+
+    def _name(self, name):
+        return '{}_{}'.format(self.alias, name)
+
+    def _optimize(self, expressions):
+        """ Inline the intermediate expressions and fold constants.
+            Returns the optimized expressions, and the keys of the
+            formulas that were inlined. Only the generated expressions
+            are optimized; the inputs keep the expressions that were
+            typed into the dialog.
+            """
+        names = {self._name(self.graph.name(key)): key for key in expressions}
+        kept = self.graph.kept(self.bound)
+        keep = {name for name, key in names.items() if key in kept}
+
+        optimized, inlined = optimize.optimize({name: expressions[key] for name, key in names.items()},
+                                               keep, self.inline_uses)
+
+        return ({names[name]: expression for name, expression in optimized.items()},
+                {names[name] for name in inlined})
+
+    def _get_param(self, input_, name, comment, save=True):
+        all_parameters = self.app.activeProduct.allParameters
+        user_parameters = self.app.activeProduct.userParameters
+        formula = 'abs({})'
+
+        param = all_parameters.itemByName(getattr(input_, 'expression', ''))
+        value = abs(input_.value)
+
+        if param:
+            expression = formula.format(param.name)
+        else:
+            if self.parametric and save:
+                expression = user_parameters.add(self._name(name),
+                                                 vi.createByString(formula.format(getattr(input_, 'expression',
+                                                                                          input_.value))),
+                                                 getattr(input_, 'unitType', ''),
+                                                 'TabGen: {}'.format(comment)).name
+            else:
+                # Inputs without an expression, such as the integer
+                # spinners, fall back to their value. Falling back to
+                # this parameter's own name would be a circular
+                # reference.
+                expression = formula.format(getattr(input_, 'expression', input_.value))
+
+        return Property(self._name(name), value, expression, comment, getattr(input_, 'unitType', ''))
+
+    @property
+    def ordered(self):
+        """ The properties that are created as model parameters, in
+            the order that they have to be created.
+            """
+        return [getattr(self, key) for key in self.graph.parameters if key not in self.inlined]
+
+    @property
+    def isValid(self):
+        """ Whether the selected face still exists, the same as for the
+            Fusion entities that are cached between previews.
+            """
+        return self.face is not None and self.face.isValid
+
+    @property
+    def layout(self):
+        return Layout(*[self.values[field] for field in Layout._fields])
+
+    @property
+    def cuts(self):
+        """ The intervals along the face that the finger features cut.
+            """
+        return Intervals.from_layout(self.layout, self.face_length.value, self.tab_first)
+
+    def save(self, properties):
+        properties.sketch.isComputeDeferred = True
+        properties.finger_cut.extentOne.distance.expression = '-{}'.format(self.adjusted_depth.name)
+
+        properties.finger_pattern.distanceOne.expression = self.pattern_distance.name
+        properties.finger_pattern.distanceTwo.expression = self.distance_two.name
+        properties.finger_pattern.quantityOne.expression = self.notches.expression
+        properties.finger_pattern.quantityTwo.expression = '2 + {}'.format(self.interior.value)
+
+        left_dimension = getattr(properties, 'left_dimension', None)
+        if left_dimension:
+            properties.left_dimension.parameter.expression = self.offset.name
+            properties.left_dimension.parameter.name = self._name('left_corner')
+        right_dimension = getattr(properties, 'right_dimension', None)
+        if right_dimension:
+            properties.right_dimension.parameter.expression = self.offset.name
+            properties.right_dimension.parameter.name = self._name('right_corner')
+        properties.sketch.isComputeDeferred = False
@@ -0,0 +1,83 @@
+""" Preview the planned cuts as custom graphics, instead of creating the
+    sketch and features. The boxes are computed from the layout and the
+    frame of the selected face, so a preview only makes a few API calls
+    no matter how many notches there are.
+    """
+from adsk.core import Color
+from adsk.fusion import CustomGraphicsCoordinates
+from adsk.fusion import CustomGraphicsSolidColorEffect
+
+CUT_COLOR = (220, 60, 40, 160)
+
+# The twelve triangles of a box, by the index of its corners
+BOX_TRIANGLES = (0, 2, 1, 0, 3, 2,
+                 4, 5, 6, 4, 6, 7,
+                 0, 1, 5, 0, 5, 4,
+                 1, 2, 6, 1, 6, 5,
+                 2, 3, 7, 2, 7, 6,
+                 3, 0, 4, 3, 4, 7)
+
+
+def _point(frame, along, across, inward):
+    return [frame.origin[axis] +
+            frame.direction[axis]*along +
+            frame.across[axis]*across +
+            frame.inward[axis]*inward for axis in range(3)]
+
+
+def boxes(frame, cuts, start_depth, depth, copies=1, spacing=0):
+    """ The corners of a box for each cut along the face, repeated for
+        each copy of the cuts that is patterned into the body.
+        """
+    for copy in range(copies):
+        top = start_depth + spacing*copy
+        bottom = top + depth
+        for start, end in cuts:
+            yield [_point(frame, along, across, inward)
+                   for inward in (top, bottom)
+                   for along, across in ((start, 0), (end, 0), (end, frame.width), (start, frame.width))]
+
+
+def mesh(corners):
+    """ Flatten the box corners into the coordinates and triangle
+        indices of a single mesh.
+        """
+    coordinates = []
+    indices = []
+    for count, box in enumerate(corners):
+        for point in box:
+            coordinates.extend(point)
+        indices.extend(index + count*8 for index in BOX_TRIANGLES)
+    return coordinates, indices
+
+
+def clear(cache):
+    if cache.graphics is not None and cache.graphics.isValid:
+        cache.graphics.deleteMe()
+    cache.graphics = None
+
+
+def draw(app, inputs, properties):
+    """ Draw the cuts for the finger properties on the selected face,
+        replacing the graphics of the last preview.
+        """
+    cache = inputs.cache
+    clear(cache)
+
+    frame = cache.frame(properties.face)
+    distance_two = abs(properties.distance_two.value)
+    if distance_two:
+        copies = inputs.interior.value + 2
+        spacing = distance_two/(copies - 1)
+    else:
+        copies, spacing = 1, 0
+
+    coordinates, indices = mesh(boxes(frame, properties.cuts, abs(properties.edge_margin.value),
+                                      properties.adjusted_depth.value, copies, spacing))
+    if not indices:
+        return
+
+    group = app.activeProduct.rootComponent.customGraphicsGroups.add()
+    cuts = group.addMesh(CustomGraphicsCoordinates.create(coordinates), indices, [], [])
+    cuts.color = CustomGraphicsSolidColorEffect.create(Color.create(*CUT_COLOR))
+    cache.graphics = group
@@ -0,0 +1,100 @@
+""" Stand-ins for the adsk modules, so that the add-in can be imported
+    outside of Fusion 360. Every name imported from them is an empty
+    class, so the handlers can subclass the event handler classes;
+    the few API classes whose values the tests read are replaced with
+    simple records.
+    """
+import importlib
+import os
+import sys
+import tempfile
+import types
+
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = 'tabgen_addin'
+
+
+class _StubType(type):
+
+    def __getattr__(cls, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        stub = _stub(name)
+        setattr(cls, name, stub)
+        return stub
+
+
+def _stub(name):
+    return _StubType(name, (), {'__init__': lambda self, *args, **kwargs: None})
+
+
+def _stub_module(name):
+    module = types.ModuleType(name)
+
+    def getattr_(attribute):
+        if attribute.startswith('__'):
+            raise AttributeError(attribute)
+        stub = _stub(attribute)
+        setattr(module, attribute, stub)
+        return stub
+
+    module.__getattr__ = getattr_
+    return module
+
+
+class ObjectCollection(list):
+
+    @classmethod
+    def create(cls):
+        return cls()
+
+    def add(self, item):
+        self.append(item)
+
+
+ValueInput = SimpleNamespace(createByReal=lambda value: SimpleNamespace(value=value),
+                             createByString=lambda text: SimpleNamespace(text=text))
+
+OffsetStartDefinition = SimpleNamespace(create=lambda offset: SimpleNamespace(offset=offset))
+
+
+def install(application=None):
+    """ Replace the adsk modules, and add a package for the add-in,
+        which is named after its folder in Fusion.
+        """
+    adsk = _stub_module('adsk')
+    for name in ('core', 'fusion', 'cam'):
+        module = _stub_module('adsk.' + name)
+        setattr(adsk, name, module)
+        sys.modules['adsk.' + name] = module
+    sys.modules['adsk'] = adsk
+
+    adsk.core.Application = SimpleNamespace(get=lambda: application)
+    adsk.core.ObjectCollection = ObjectCollection
+    adsk.core.ValueInput = ValueInput
+    adsk.fusion.OffsetStartDefinition = OffsetStartDefinition
+
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [ROOT]
+    sys.modules[PACKAGE] = package
+
+
+def uninstall():
+    for name in list(sys.modules):
+        if name == 'adsk' or name.startswith('adsk.') or name == PACKAGE or name.startswith(PACKAGE + '.'):
+            del sys.modules[name]
+
+
+def load(name):
+    """ Import a module of the add-in, such as 'core.managers.fingers'.
+        """
+    # TabGen.py opens its log file in the working directory
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            return importlib.import_module('{}.{}'.format(PACKAGE, name))
+        finally:
+            os.chdir(cwd)
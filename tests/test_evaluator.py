@@ -0,0 +1,64 @@
+import unittest
+
+from core.layout import evaluator
+
+
+class UnitTest(unittest.TestCase):
+
+    def test_unit_applies_to_a_term_of_plain_numbers(self):
+        self.assertAlmostEqual(evaluator.evaluate('1/8 in', units='in'), 0.125)
+        self.assertAlmostEqual(evaluator.evaluate('1/8 in', units='mm'), 3.175)
+        self.assertAlmostEqual(evaluator.evaluate('3/4 in * 2', units='in'), 1.5)
+        self.assertAlmostEqual(evaluator.evaluate('-1/2 in', units='in'), -0.5)
+        self.assertAlmostEqual(evaluator.evaluate('(1 + 1) mm', units='cm'), 0.2)
+
+    def test_unit_applies_to_the_number_after_a_parameter(self):
+        self.assertAlmostEqual(evaluator.evaluate('x/1mm', {'x': 6}, units='cm'), 60)
+        self.assertAlmostEqual(evaluator.evaluate('x*2mm', {'x': 3}, units='cm'), 0.6)
+        self.assertAlmostEqual(evaluator.evaluate('x mm', {'x': 3}, units='cm'), 0.3)
+
+    def test_unit_ends_at_addition(self):
+        self.assertAlmostEqual(evaluator.evaluate('1in + 2mm', units='mm'), 27.4)
+        self.assertAlmostEqual(evaluator.evaluate('2 + 3 mm', units='cm'), 2.3)
+
+    def test_numbers_without_units_are_in_the_evaluation_units(self):
+        self.assertAlmostEqual(evaluator.evaluate('3', units='in'), 3)
+        self.assertAlmostEqual(evaluator.evaluate('x/1mm', {'x': 6}, units='mm'), 6)
+        self.assertAlmostEqual(evaluator.evaluate('x/1cm', {'x': 6}, units='mm'), 0.6)
+
+    def test_unknown_units(self):
+        for expression in ('3 furlong', '3 mm in', 'x y'):
+            with self.assertRaises(evaluator.ExpressionError):
+                evaluator.parse(expression)
+
+
+class ExpressionTest(unittest.TestCase):
+
+    def test_functions(self):
+        self.assertEqual(evaluator.evaluate('max(3; floor(7/2))'), 3)
+        self.assertEqual(evaluator.evaluate('(ceil(max(3; floor(10 / 2))/2)*2)-1'), 5)
+        with self.assertRaises(evaluator.ExpressionError):
+            evaluator.parse('max(3)')
+        with self.assertRaises(evaluator.ExpressionError):
+            evaluator.parse('cosine(3)')
+
+    def test_precedence(self):
+        self.assertEqual(evaluator.evaluate('2 + 3*4'), 14)
+        self.assertEqual(evaluator.evaluate('-2^2'), -4)
+        self.assertEqual(evaluator.evaluate('2^3^2'), 512)
+
+    def test_evaluate_all_reports_every_error(self):
+        with self.assertRaises(evaluator.ParameterSetError) as caught:
+            evaluator.evaluate_all({'a': 'b + 1', 'c': '1/0', 'd': 'e'}, {'b': 1})
+        self.assertEqual(set(caught.exception.errors), {'c', 'd'})
+
+    def test_evaluate_all_orders_dependencies(self):
+        results = evaluator.evaluate_all({'c': 'b*2', 'b': 'a + 1'}, {'a': 1})
+        self.assertEqual(results, {'c': 4, 'b': 2})
+
+        with self.assertRaises(evaluator.ParameterSetError):
+            evaluator.evaluate_all({'a': 'b', 'b': 'a'})
+
+
+if __name__ == '__main__':
+    unittest.main()
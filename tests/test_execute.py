@@ -0,0 +1,67 @@
+""" Execute checks the cost of the fingers before it creates anything
+    in the document.
+    """
+import unittest
+
+from types import SimpleNamespace
+from unittest import mock
+
+import fusionstubs
+
+_modules = {}
+
+
+def setUpModule():
+    fusionstubs.install()
+    # In the order that TabGen.py imports them
+    fusionstubs.load('core.handlers')
+    for name in ('core.handlers.commandexecutehandler', 'core.layout.cost', 'core.managers'):
+        _modules[name.split('.')[-1]] = fusionstubs.load(name)
+
+
+def tearDownModule():
+    fusionstubs.uninstall()
+
+
+class ExecuteTest(unittest.TestCase):
+
+    def execute(self, instances, answer=None):
+        handler_module = _modules['commandexecutehandler']
+        config = SimpleNamespace(ui=mock.Mock(), app=mock.Mock(), WARN_INSTANCES=400, MAX_INSTANCES=2000)
+        config.ui.messageBox.return_value = answer
+        handler = handler_module.CommandExecuteHandler(config, mock.Mock())
+
+        inputs = mock.Mock(face_selected=True)
+        estimate = _modules['cost'].Cost(instances, 0, 0, 0)
+        managers = _modules['managers']
+        with mock.patch.object(handler_module.fusion, 'InputReader', return_value=inputs), \
+                mock.patch.object(managers, 'plan_layout'), \
+                mock.patch.object(managers, 'plan_estimate', return_value=estimate), \
+                mock.patch.object(managers.graphics, 'clear'), \
+                mock.patch.object(managers, 'create') as create:
+            handler.notify(mock.MagicMock())
+        return inputs, create, config.ui.messageBox
+
+    def test_too_large_is_refused_before_the_face_is_numbered(self):
+        inputs, create, message = self.execute(2001)
+
+        inputs.create_properties.assert_not_called()
+        create.assert_not_called()
+        self.assertIn('too large', message.call_args[0][0])
+
+    def test_declined_warning_creates_nothing(self):
+        inputs, create, message = self.execute(401)
+
+        inputs.create_properties.assert_not_called()
+        create.assert_not_called()
+        self.assertIn('slow', message.call_args[0][0])
+
+    def test_within_limits_creates_the_fingers(self):
+        inputs, create, message = self.execute(10)
+
+        message.assert_not_called()
+        create.assert_called_once_with(inputs, inputs.create_properties.return_value, preview=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
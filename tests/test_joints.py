@@ -0,0 +1,184 @@
+""" The joint records that are checked for corner conflicts, compared
+    with the cuts that FingerManager asks Fusion to build.
+    """
+import json
+import unittest
+
+from types import SimpleNamespace
+from unittest import mock
+
+import fusionstubs
+
+_modules = {}
+
+
+def setUpModule():
+    fusionstubs.install()
+    # In the order that TabGen.py imports them
+    fusionstubs.load('core.handlers')
+    for name in ('core.managers.fingers', 'core.managers.fingermanager', 'core.fusion.body.joints',
+                 'core.layout', 'core.fusion.face.faceframe'):
+        _modules[name.split('.')[-1]] = fusionstubs.load(name)
+
+
+def tearDownModule():
+    fusionstubs.uninstall()
+
+
+def _value(value):
+    return SimpleNamespace(value=value)
+
+
+def _joint(tab_first=False, edge_margin=0.2, distance=6.0, interior=2):
+    """ The properties of a joint, and the dialog inputs for it, with
+        the face lying in the XY plane and the body below it.
+        """
+    layout_ = _modules['layout']
+    layout = layout_.auto_width(10.0, 0.8, 0.32, distance=distance, edge_margin=edge_margin,
+                                tab_first=tab_first)
+    properties = SimpleNamespace(
+        name='Box Top1', alias='Box_Top1', app=mock.Mock(), ui=mock.Mock(), face=mock.Mock(),
+        parametric=False, tab_first=tab_first, layout=layout,
+        face_length=_value(10.0), edge_margin=_value(edge_margin),
+        cuts=layout_.Intervals.from_layout(layout, 10.0, tab_first),
+        **{field: _value(getattr(layout, field)) for field in layout._fields})
+    frame = _modules['faceframe'].Frame((1.0, 2.0, 3.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0),
+                                        (0.0, 0.0, -1.0), 10.0, 0.32)
+    inputs = SimpleNamespace(interior=_value(interior), cache=SimpleNamespace(frame=lambda face: frame))
+    return properties, inputs, frame
+
+
+def _built_offsets(manager, pattern):
+    """ How far into the body each copy of a cut is built, from the
+        values passed to the extrude and to the rectangular pattern.
+        """
+    extrudes = mock.Mock()
+    extrudes.createInput.return_value = mock.Mock(startExtent=None)
+    extrudes.add.side_effect = lambda cut_input: cut_input
+    cut = manager.extrude_finger(mock.Mock(), extrudes, mock.MagicMock(),
+                                 manager.properties.edge_margin.value)
+    start = -cut.startExtent.offset.value if cut.startExtent else 0
+
+    body = mock.Mock()
+    patterns = body.parentComponent.features.rectangularPatternFeatures
+    patterns.add.return_value.healthState = 0
+    pattern(manager)(body, mock.Mock(isValid=True), mock.Mock(isValid=True), cut)
+
+    direction_two = patterns.createInput.return_value.setDirectionTwo
+    if not direction_two.called:
+        return [start]
+    _, quantity, extent = direction_two.call_args[0]
+    return [start + extent.value*copy/(quantity.value - 1) for copy in range(int(quantity.value))]
+
+
+def _planned_offsets(joints, frame):
+    return [sum((a - b)*axis for a, b, axis in zip(joint.origin, frame.origin, frame.inward))
+            for joint in joints]
+
+
+class PlanJointsTest(unittest.TestCase):
+
+    def assertOffsets(self, first, second):
+        self.assertEqual(len(first), len(second))
+        for a, b in zip(first, second):
+            self.assertAlmostEqual(a, b)
+
+    def test_copies_match_the_built_cuts(self):
+        for edge_margin, distance, interior in ((0.2, 6.0, 2), (0, 6.0, 0), (0.3, 0, 1)):
+            properties, inputs, frame = _joint(edge_margin=edge_margin, distance=distance, interior=interior)
+            manager = _modules['fingermanager'].FingerManager(inputs, properties, None)
+
+            joints = _modules['fingers'].plan_joints(inputs, properties)
+            built = _built_offsets(manager, lambda manager: manager.duplicate_finger)
+            self.assertOffsets(_planned_offsets(joints, frame), built)
+
+    def test_only_the_faces_with_corner_cuts_record_them(self):
+        properties, inputs, frame = _joint(tab_first=False)
+        manager = _modules['fingermanager'].FingerManager(inputs, properties, None)
+
+        joints = _modules['fingers'].plan_joints(inputs, properties)
+        corner = (0, properties.offset.value)
+        with_corners = [joint for joint in joints if joint.cuts.intersects(*corner)]
+
+        built = _built_offsets(manager, lambda manager: manager.duplicate_corner)
+        self.assertOffsets(_planned_offsets(with_corners, frame), built)
+
+
+class FakeAttributes:
+
+    def __init__(self):
+        self.values = {}
+
+    def itemByName(self, group, name):
+        if (group, name) in self.values:
+            return self.values[(group, name)]
+        return None
+
+    def add(self, group, name, value):
+        self.values[(group, name)] = SimpleNamespace(value=value)
+
+
+def _body(features):
+    body = mock.Mock()
+    body.attributes = FakeAttributes()
+    body.parentComponent.features.extrudeFeatures.itemByName.side_effect = features.get
+    return body
+
+
+class SavedJointsTest(unittest.TestCase):
+
+    def test_joints_without_features_are_dropped(self):
+        properties, inputs, _ = _joint()
+        joints = _modules['fingers'].plan_joints(inputs, properties)
+        kept = joints[0]._replace(name='kept', feature='Extrude1')
+        deleted = joints[0]._replace(name='deleted', feature='Extrude2')
+        suppressed = joints[0]._replace(name='suppressed', feature='Extrude3')
+
+        features = {'Extrude1': mock.Mock(isSuppressed=False), 'Extrude3': mock.Mock(isSuppressed=True)}
+        body = _body(features)
+        _modules['joints'].save_joints(body, [kept, deleted, suppressed])
+
+        self.assertEqual([joint.name for joint in _modules['joints'].saved_joints(body)], ['kept'])
+        stored = json.loads(body.attributes.itemByName('tabgen', 'joints').value)
+        self.assertEqual([joint['name'] for joint in stored], ['kept', 'suppressed'])
+
+        del features['Extrude1']
+        self.assertEqual(_modules['joints'].saved_joints(body), [])
+
+
+class CreateTest(unittest.TestCase):
+
+    def create(self, draw):
+        fingers = _modules['fingers']
+        properties, inputs, _ = _joint()
+        inputs.selected_face = properties.face
+
+        manager = mock.Mock()
+        manager.return_value.draw.side_effect = draw
+        with mock.patch.object(fingers, 'initialize_sketch'), \
+                mock.patch.object(fingers, 'create_sketch_border'), \
+                mock.patch.object(fingers, 'check_corners'), \
+                mock.patch.object(fingers, 'FingerManager', manager), \
+                mock.patch.object(fingers.fusion, 'save_joints') as save_joints:
+            try:
+                fingers.create(inputs, properties, preview=False)
+            except RuntimeError:
+                pass
+        return save_joints
+
+    def test_joints_are_saved_once_they_are_built(self):
+        built = SimpleNamespace(finger_cut=SimpleNamespace(name='Extrude7'))
+        save_joints = self.create(lambda sketch: built)
+
+        save_joints.assert_called_once()
+        self.assertEqual({joint.feature for joint in save_joints.call_args[0][1]}, {'Extrude7'})
+
+    def test_nothing_is_saved_when_the_build_fails(self):
+        def fail(sketch):
+            raise RuntimeError('extrude failed')
+
+        self.create(fail).assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
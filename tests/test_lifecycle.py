@@ -0,0 +1,154 @@
+""" Open and close the TabGen command repeatedly, outside of Fusion 360,
+    and check that nothing from a closed dialog is kept alive.
+
+    The adsk modules are replaced with the stubs in fusionstubs. The
+    application, user interface and command are mocks.
+
+        python -m pytest tests
+    """
+import gc
+import tracemalloc
+import unittest
+
+from types import SimpleNamespace
+from unittest import mock
+
+import fusionstubs
+
+CYCLES = 200
+WARMUP = 20
+
+# Traced memory may grow by this many bytes over all of the cycles,
+# for interned strings and caches that fill up slowly.
+ALLOWED_GROWTH = 64*1024
+
+
+class FakeEvent:
+
+    def __init__(self):
+        self.handlers = []
+
+    def add(self, handler):
+        self.handlers.append(handler)
+        return True
+
+    def remove(self, handler):
+        self.handlers.remove(handler)
+        return True
+
+
+class FakeApplication:
+    """ Keeps the custom events that are registered, so that the test
+        can check that they are all unregistered again.
+        """
+
+    def __init__(self):
+        self.events = {}
+        self.userInterface = mock.Mock()
+        self.activeDocument = SimpleNamespace(isSaved=True)
+        self.activeProduct = SimpleNamespace(
+            unitsManager=SimpleNamespace(defaultLengthUnits='mm'),
+            fusionUnitsManager=SimpleNamespace(distanceDisplayUnits=0))
+
+    def registerCustomEvent(self, id_):
+        self.events[id_] = FakeEvent()
+        return self.events[id_]
+
+    def unregisterCustomEvent(self, id_):
+        return self.events.pop(id_, None) is not None
+
+    def fireCustomEvent(self, id_, info=''):
+        return True
+
+
+_application = FakeApplication()
+_modules = {}
+
+
+def setUpModule():
+    fusionstubs.install(_application)
+    _modules['TabGen'] = fusionstubs.load('TabGen')
+    _modules['config'] = fusionstubs.load('config')
+    _modules['destroy'] = fusionstubs.load('core.handlers.commanddestroyhandler')
+
+
+def tearDownModule():
+    fusionstubs.uninstall()
+
+
+class CommandLifecycleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.app = _application
+        self.ui = self.app.userInterface
+        self.ui.reset_mock()
+        self.panel = _modules['TabGen'].CommandCreatedEventHandlerPanel(_modules['config'].Configuration(self.app))
+
+    def cycle(self):
+        """ Open the command dialog, use the session cache the way the
+            selection handlers do, then close the dialog.
+            """
+        args = mock.MagicMock()
+        self.panel.notify(args)
+
+        destroy, = [handler for handler in self.panel.handlers
+                    if isinstance(handler, _modules['destroy'].CommandDestroyHandler)]
+        cache = destroy.cache
+        cache.get(('dimensions', 'face'), lambda: bytearray(1024))
+        cache.graphics = mock.Mock(isValid=True)
+        graphics = cache.graphics
+
+        destroy.notify(mock.Mock())
+        return cache, graphics
+
+    def test_destroy_releases_handlers_and_cache(self):
+        cache, graphics = self.cycle()
+
+        self.assertEqual(self.panel.handlers, [])
+        self.assertEqual(len(cache.entries), 0)
+        self.assertIsNone(cache.graphics)
+        graphics.deleteMe.assert_called_once_with()
+        self.assertEqual(self.app.events, {})
+        self.ui.messageBox.assert_not_called()
+
+    def test_repeated_open_and_cancel_keeps_memory_flat(self):
+        for _ in range(WARMUP):
+            self.cycle()
+        gc.collect()
+
+        tracemalloc.start()
+        try:
+            start = tracemalloc.get_traced_memory()[0]
+            for _ in range(CYCLES):
+                cache, _ = self.cycle()
+                self.assertEqual(self.panel.handlers, [])
+                self.assertEqual(len(cache.entries), 0)
+            del cache
+            gc.collect()
+            growth = tracemalloc.get_traced_memory()[0] - start
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(self.app.events, {})
+        self.ui.messageBox.assert_not_called()
+        self.assertLess(growth, ALLOWED_GROWTH,
+                        'traced memory grew by {} bytes over {} cycles'.format(growth, CYCLES))
+
+    def test_stop_releases_the_command_created_handlers(self):
+        tabgen = _modules['TabGen']
+        cmd_def = self.ui.commandDefinitions.itemById.return_value
+
+        tabgen.run({'IsApplicationStartup': True})
+        self.assertEqual(len(tabgen.handlers), 1)
+        panel = tabgen.handlers[0]
+        panel.handlers.append(object())
+
+        tabgen.stop({'IsApplicationStartup': False})
+        self.assertEqual(tabgen.handlers, [])
+        self.assertEqual(panel.handlers, [])
+        cmd_def.commandCreated.remove.assert_called_with(panel)
+        self.ui.messageBox.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from core.layout import evaluator
+from core.layout import optimize
+
+
+def _optimize(expression, name='p_depth'):
+    return optimize.optimize({name: expression}, {name})[0][name]
+
+
+class FoldTest(unittest.TestCase):
+
+    def assertSameValue(self, first, second):
+        for units in ('mm', 'cm', 'in'):
+            self.assertAlmostEqual(evaluator.evaluate(first, units=units),
+                                   evaluator.evaluate(second, units=units))
+
+    def test_folds_plain_numbers(self):
+        self.assertEqual(_optimize('abs(3/4)'), '0.75')
+        self.assertEqual(_optimize('(2 + 3)*x'), '5*x')
+
+    def test_keeps_units(self):
+        for expression in ('abs(3/4 in)', '1in + 2mm', '-(3 mm)', 'max(1in; 20mm)', 'abs(2mm)*3'):
+            optimized = _optimize(expression)
+            self.assertSameValue(expression, optimized)
+
+        self.assertIn('in', _optimize('abs(3/4 in)'))
+        self.assertEqual(_optimize('-(3 mm)'), '-3mm')
+
+    def test_keeps_units_in_inlined_expressions(self):
+        optimized, inlined = optimize.optimize({'a': '2in', 'b': 'a*2', 'c': 'b + 1mm'}, {'c'})
+        self.assertEqual(inlined, {'a', 'b'})
+        self.assertSameValue(optimized['c'], '2in*2 + 1mm')
+        self.assertIn('in', optimized['c'])
+        self.assertIn('mm', optimized['c'])
+
+    def test_identities_only_drop_plain_numbers(self):
+        self.assertEqual(_optimize('x*1'), 'x')
+        self.assertEqual(_optimize('x + 0'), 'x')
+        self.assertEqual(_optimize('x/1mm'), 'x/1mm')
+        self.assertEqual(_optimize('x*1in'), 'x*1in')
+
+
+if __name__ == '__main__':
+    unittest.main()
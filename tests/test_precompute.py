@@ -0,0 +1,189 @@
+""" The analysis of a selected face runs in small steps before the first
+    preview, and the preview then finds everything it reads in the
+    session cache.
+    """
+import unittest
+
+from collections import deque
+from types import SimpleNamespace
+from unittest import mock
+
+import fusionstubs
+
+_modules = {}
+
+FACES = 20
+
+
+def setUpModule():
+    fusionstubs.install()
+    # In the order that TabGen.py imports them
+    fusionstubs.load('core.handlers')
+    for name in ('core.handlers.precompute', 'core.handlers.commandexecutepreviewhandler',
+                 'core.fusion.cache', 'core.fusion.body.faceclassification'):
+        _modules[name.split('.')[-1]] = fusionstubs.load(name)
+
+
+def tearDownModule():
+    fusionstubs.uninstall()
+
+
+class Vector:
+
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+    def copy(self):
+        return Vector(self.x, self.y, self.z)
+
+    def normalize(self):
+        length = (self.x**2 + self.y**2 + self.z**2)**0.5
+        self.scaleBy(1/length)
+
+    def scaleBy(self, scale):
+        self.x, self.y, self.z = self.x*scale, self.y*scale, self.z*scale
+
+
+def _body(marker=5):
+    """ A body of planar faces, in a design whose timeline marker stays
+        where it is.
+        """
+    body = SimpleNamespace(entityToken='body', faces=[])
+    body.parentComponent = SimpleNamespace(
+        parentDesign=SimpleNamespace(timeline=SimpleNamespace(markerPosition=marker)))
+    for index in range(FACES):
+        normal = [0, 0, 0]
+        normal[index % 3] = 1
+        body.faces.append(SimpleNamespace(
+            entityToken='face{}'.format(index), area=index + 1.0, isValid=True, isParamReversed=False,
+            geometry=SimpleNamespace(normal=Vector(*normal), origin=Vector(index, index, index)),
+            body=body, vertices=[SimpleNamespace(entityToken='vertex{}.{}'.format(index, corner))
+                                 for corner in range(4)]))
+    body.faces = FaceList(body.faces)
+    return body
+
+
+class FaceList(list):
+
+    @property
+    def count(self):
+        return len(self)
+
+
+class FakeApplication:
+    """ Queues the custom events, which Fusion would handle once it is
+        idle.
+        """
+
+    def __init__(self):
+        self.fired = deque()
+        self.handlers = {}
+
+    def registerCustomEvent(self, id_):
+        return SimpleNamespace(add=lambda handler: self.handlers.__setitem__(id_, handler),
+                               remove=lambda handler: self.handlers.pop(id_))
+
+    def unregisterCustomEvent(self, id_):
+        return True
+
+    def fireCustomEvent(self, id_, info=''):
+        self.fired.append((id_, info))
+        return True
+
+    def idle(self):
+        """ Handle the queued events, and return how many there were.
+            """
+        count = 0
+        while self.fired:
+            id_, info = self.fired.popleft()
+            self.handlers[id_].notify(SimpleNamespace(additionalInfo=info))
+            count += 1
+        return count
+
+
+class PrecomputeTest(unittest.TestCase):
+
+    def setUp(self):
+        cache_module = _modules['cache']
+        self.patches = [mock.patch.object(cache_module, name, side_effect=lambda *args: mock.Mock())
+                        for name in ('dimensions', 'face_orientation', 'face_frame',
+                                     'perpendicular_edge_from_vertex', 'distance_between_faces', 'Topology')]
+        for patch in self.patches:
+            patch.start()
+
+        self.app = FakeApplication()
+        self.command = mock.Mock()
+        self.cache = cache_module.SessionCache()
+        self.precompute = _modules['precompute'].Precompute(self.app, mock.Mock(), self.command, self.cache)
+        self.body = _body()
+        self.face = self.body.faces[0]
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+
+    def preview_reads(self, face, other):
+        cache = self.cache
+        cache.dimensions(face)
+        cache.orientation(face)
+        cache.frame(face)
+        cache.is_edge(face)
+        for vertex in face.vertices:
+            cache.perpendicular_edge(face, vertex)
+        cache.distance(self.app, face, other)
+
+    def test_the_preview_uses_the_precomputed_entries(self):
+        other = self.body.faces[3]
+        self.precompute.start(self.face, other)
+        self.assertTrue(self.precompute.pending)
+        self.command.doExecutePreview.assert_not_called()
+
+        self.app.idle()
+        self.assertFalse(self.precompute.pending)
+        self.command.doExecutePreview.assert_called_once_with()
+
+        misses = self.cache.misses
+        with mock.patch.object(_modules['cache'], 'FaceClassification') as classification:
+            self.preview_reads(self.face, other)
+        self.assertEqual(self.cache.misses, misses)
+        classification.assert_not_called()
+
+    def test_the_classification_is_split_into_steps(self):
+        steps = _modules['faceclassification'].FACES_PER_STEP
+        self.precompute.start(self.face, self.body.faces[3])
+        events = self.app.idle()
+
+        # Dimensions, orientation, frame, the vertices and the distance
+        # each take one step besides the classification.
+        self.assertEqual(events, 3 + -(-FACES//steps) + len(self.face.vertices))
+
+        classification = self.cache.classification(self.body)
+        self.assertEqual(classification.tokens, [face.entityToken for face in self.body.faces])
+        self.assertEqual(classification.edges, frozenset(range(FACES - 2)))
+
+    def test_a_new_selection_drops_the_pending_steps(self):
+        self.precompute.start(self.face, self.body.faces[3])
+        other = _body(marker=6)
+        self.precompute.start(other.faces[1], other.faces[4])
+        self.app.idle()
+
+        self.command.doExecutePreview.assert_called_once_with()
+        self.assertNotIn(('dimensions', self.face.entityToken), self.cache.entries)
+        self.assertIn(('dimensions', other.faces[1].entityToken), self.cache.entries)
+
+    def test_the_preview_waits_for_the_analysis(self):
+        handler_module = _modules['commandexecutepreviewhandler']
+        config = SimpleNamespace(ui=mock.Mock(), app=mock.Mock())
+        scheduler = SimpleNamespace(pending=False)
+        handler = handler_module.CommandExecutePreviewHandler(config, self.cache, scheduler, self.precompute)
+
+        self.precompute.start(self.face)
+        args = mock.Mock()
+        with mock.patch.object(handler_module.fusion, 'InputReader') as reader:
+            handler.notify(args)
+        self.assertFalse(args.isValidResult)
+        reader.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()